@@ -0,0 +1,82 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.chdir(ROOT)
+
+from PyQt6.QtGui import QPixmap  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from models.episode import Episode  # noqa: E402
+from utils import getStylesheet  # noqa: E402
+from views.episode_select import EpisodeSelect  # noqa: E402
+
+ROWS = 10000
+FRAMES = 1000
+SCROLL_STEP = 3
+WIDTH = 800
+HEIGHT = 600
+
+
+def makeEpisodes(count: int) -> list[Episode]:
+    episodes: list[Episode] = []
+    for i in range(count):
+        name = f"Show.Name.S{i // 100 + 1:02}E{i % 100 + 1:02}.1080p.WEB-DL.mkv"
+        progress = float(i % 3 == 1)
+        episodes.append(Episode(name, f"/library/Show/{name}", "/library/Show", progress, i % 3 == 2))
+    return episodes
+
+
+def measure(page: EpisodeSelect, frames: int, step: int) -> list[float]:
+    scrollBar = page._list.verticalScrollBar()
+    viewport = page._list.viewport()
+    target = QPixmap(viewport.size())
+
+    times: list[float] = []
+    for frame in range(frames):
+        scrollBar.setValue(frame * step % (scrollBar.maximum() + 1))
+        page._list.setCurrentIndex(page._list.indexAt(viewport.rect().center()))
+        start = time.perf_counter()
+        viewport.render(target)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure episode list paint cost per frame.")
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--step", type=int, default=SCROLL_STEP, help="rows scrolled per frame")
+    parser.add_argument("--max-p95", type=float, default=None, help="fail when the p95 frame time exceeds this (ms)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet(getStylesheet("_internal/styles.qss"))
+
+    page = EpisodeSelect(None)
+    page.resize(WIDTH, HEIGHT)
+    page.setEpisodes(makeEpisodes(args.rows))
+    page.show()
+    app.processEvents()
+
+    measure(page, 10, args.step)
+    times = sorted(measure(page, args.frames, args.step))
+    p95 = times[int(len(times) * 0.95) - 1]
+    rows = page._list.viewport().height() // max(1, page._list.sizeHintForRow(0))
+    print(f"rows={args.rows} frames={args.frames} step={args.step} visible~{rows}")
+    mean, p50 = statistics.fmean(times), statistics.median(times)
+    print(f"mean={mean:.3f}ms p50={p50:.3f}ms p95={p95:.3f}ms max={times[-1]:.3f}ms")
+
+    if args.max_p95 is not None and p95 > args.max_p95:
+        print(f"p95 {p95:.3f}ms exceeds {args.max_p95:.3f}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
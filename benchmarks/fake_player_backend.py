@@ -0,0 +1,181 @@
+import os
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from services.player_backend import PlayerBackend  # noqa: E402
+
+FAKE_DURATION = 1440.0
+
+
+class FakePlayerBackend(PlayerBackend):
+    def __init__(self, wid: str = "", duration: float = FAKE_DURATION) -> None:
+        self.wid = wid
+        self.duration = duration
+        self.playlist: list[tuple[str, float | None]] = []
+        self.position = -1
+        self.paused = True
+        self.timePos: float | None = None
+        self.started: list[tuple[str, float]] = []
+        self.counters = {"emitted": 0, "commands": 0, "errors": 0}
+        self._keys: dict[str, Callable[[], None]] = {}
+        self._observers: dict[str, list[Callable[[str, object], None]]] = {}
+        self._events: dict[str, list[Callable[[], None]]] = {}
+        self._lock = threading.RLock()
+        self._queue: queue.Queue[tuple[float, Callable[..., object], tuple] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="fake-player-events", daemon=True)
+        self._thread.start()
+
+    def onKeyPress(self, key: str, callback: Callable[[], None]) -> None:
+        self._keys[key] = callback
+
+    def observe(self, name: str, callback: Callable[[str, object], None]) -> None:
+        self._observers.setdefault(name, []).append(callback)
+
+    def onEvent(self, name: str, callback: Callable[[], None]) -> None:
+        self._events.setdefault(name, []).append(callback)
+
+    def command(self, *args: str) -> None:
+        with self._lock:
+            self.counters["commands"] += 1
+            if args[0] == "keypress" and args[1] in self._keys:
+                self._queue.put((0.0, self._keys[args[1]], ()))
+            elif args[0] == "playlist-next" and self.position < len(self.playlist) - 1:
+                self._setPosition(self.position + 1)
+            elif args[0] == "playlist-prev" and self.position > 0:
+                self._setPosition(self.position - 1)
+            elif args[0] == "playlist-move":
+                self._move(int(args[1]), int(args[2]))
+            elif args[0] == "playlist-remove":
+                self._remove(int(args[1]))
+
+    def stop(self) -> None:
+        with self._lock:
+            self.playlist.clear()
+            self._setPosition(-1)
+
+    def clearPlaylist(self) -> None:
+        with self._lock:
+            if self.position >= 0:
+                self.playlist[:] = [self.playlist[self.position]]
+                self._setPosition(0)
+            else:
+                self.playlist.clear()
+
+    def appendFiles(self, paths: list[str]) -> None:
+        with self._lock:
+            self.playlist.extend((path, None) for path in paths)
+
+    def appendFile(self, path: str, start: float | None = None) -> None:
+        with self._lock:
+            self.playlist.append((path, start))
+
+    def playlistPosition(self) -> int:
+        return self.position
+
+    def setPlaylistPosition(self, position: int) -> None:
+        with self._lock:
+            self._setPosition(position if 0 <= position < len(self.playlist) else -1)
+
+    def playlistCount(self) -> int:
+        return len(self.playlist)
+
+    def setPaused(self, paused: bool) -> None:
+        self.paused = paused
+
+    def seek(self, position: float) -> None:
+        self._emit("time-pos", position)
+        self._emit("playback-restart", None)
+
+    def finish(self) -> None:
+        with self._lock:
+            self._setPosition(self.position + 1 if self.position < len(self.playlist) - 1 else -1)
+
+    def playPositions(self, positions: Iterable[float], rate: float = 0.0) -> None:
+        self.replay((("time-pos", position) for position in positions), rate)
+
+    def replay(self, events: Iterable[tuple[str, object]], rate: float = 0.0) -> None:
+        start = time.perf_counter()
+        for i, (name, value) in enumerate(events):
+            self._queue.put((start + i / rate if rate > 0 else 0.0, self._dispatch, (name, value)))
+
+    def waitIdle(self) -> None:
+        self._queue.join()
+
+    def isIdle(self) -> bool:
+        return self._queue.unfinished_tasks == 0
+
+    def terminate(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _setPosition(self, position: int) -> None:
+        if position == self.position:
+            return
+
+        self.position = position
+        self._emit("playlist-pos", position)
+        if position >= 0:
+            path, start = self.playlist[position]
+            self.started.append((path, start or 0.0))
+            self._emit("file-loaded", None)
+            self._emit("duration", self.duration)
+            self._emit("time-pos", start or 0.0)
+            self._emit("playback-restart", None)
+
+    def _move(self, index: int, target: int) -> None:
+        current = self.playlist[self.position] if self.position >= 0 else None
+        entry = self.playlist.pop(index)
+        self.playlist.insert(target if target < index else target - 1, entry)
+        if current is not None:
+            self._shiftPosition(self.playlist.index(current))
+
+    def _remove(self, index: int) -> None:
+        if index == self.position:
+            del self.playlist[index]
+            self.position = -1
+            self._setPosition(index if index < len(self.playlist) else -1)
+            return
+
+        del self.playlist[index]
+        if index < self.position:
+            self._shiftPosition(self.position - 1)
+
+    def _shiftPosition(self, position: int) -> None:
+        if position != self.position:
+            self.position = position
+            self._emit("playlist-pos", position)
+
+    def _emit(self, name: str, value: object) -> None:
+        self._queue.put((0.0, self._dispatch, (name, value)))
+
+    def _dispatch(self, name: str, value: object) -> None:
+        self.counters["emitted"] += 1
+        if name == "time-pos":
+            self.timePos = value
+        for callback in self._observers.get(name, []):
+            callback(name, value)
+        for callback in self._events.get(name, []):
+            callback()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                due, function, args = item
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                function(*args)
+            except Exception as e:
+                self.counters["errors"] += 1
+                print(f"Fake player callback failed: {e}")
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,96 @@
+import argparse
+import os
+import random
+import sys
+from dataclasses import dataclass
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from models.episode import Episode  # noqa: E402
+from models.title import Title  # noqa: E402
+from services.progress_store import JsonProgressStore  # noqa: E402
+
+STATUS_FILE = "quickplay.json"
+EXTENSIONS = [".mkv", ".mp4"]
+
+
+@dataclass
+class LibraryConfig:
+    folders: int = 2
+    titles: int = 500
+    episodes: int = 24
+    nesting: int = 1
+    progress: float = 0.5
+    seed: int = 1
+
+
+def generateLibrary(root: str, config: LibraryConfig) -> tuple[list[str], list[Title]]:
+    rng = random.Random(config.seed)
+    store = JsonProgressStore()
+    paths = [os.path.join(root, f"Library {i + 1}") for i in range(config.folders)]
+    generated: list[Title] = []
+    episodes = config.episodes
+
+    for i in range(config.titles):
+        folder = paths[i % config.folders]
+        title = Title(f"Show {i:05} ({2000 + i % 25})", folder)
+        directory = os.path.join(folder, title.name)
+        os.makedirs(directory)
+        generated.append(title)
+
+        names = [
+            f"Show.{i:05}.S{e // 12 + 1:02}E{e % 12 + 1:02}.1080p.WEB-DL{EXTENSIONS[e % 2]}" for e in range(episodes)
+        ]
+        for name in names:
+            with open(os.path.join(directory, name), "wb") as file:
+                file.write(name.encode())
+        with open(os.path.join(directory, "cover.jpg"), "wb"):
+            pass
+
+        extras = directory
+        for depth in range(config.nesting):
+            extras = os.path.join(extras, f"Extras {depth + 1}")
+            os.makedirs(extras)
+            with open(os.path.join(extras, f"Featurette {depth + 1}.mkv"), "wb"):
+                pass
+
+        if rng.random() < config.progress:
+            watched = rng.randrange(episodes + 1)
+            status = [
+                Episode(name, os.path.join(directory, name), directory, 0.0, e < watched)
+                for e, name in enumerate(names)
+            ]
+            if watched < episodes:
+                status[watched].progress = rng.uniform(1.0, 1400.0)
+            store.saveEpisodes(os.path.join(directory, STATUS_FILE), status)
+
+    return paths, generated
+
+
+def addLibraryArguments(parser: argparse.ArgumentParser) -> None:
+    defaults = LibraryConfig()
+    parser.add_argument("--folders", type=int, default=defaults.folders)
+    parser.add_argument("--titles", type=int, default=defaults.titles)
+    parser.add_argument("--episodes", type=int, default=defaults.episodes)
+    parser.add_argument("--nesting", type=int, default=defaults.nesting, help="depth of extra folders per title")
+    parser.add_argument("--progress", type=float, default=defaults.progress, help="share of titles with status")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def libraryConfig(args: argparse.Namespace) -> LibraryConfig:
+    return LibraryConfig(args.folders, args.titles, args.episodes, args.nesting, args.progress, args.seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic library for benchmarks.")
+    parser.add_argument("root")
+    addLibraryArguments(parser)
+    args = parser.parse_args()
+
+    folders, titles = generateLibrary(args.root, libraryConfig(args))
+    print(f"Generated {len(titles)} titles in {len(folders)} folders under '{args.root}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+
+import simplejson as json  # noqa: E402
+from fake_player_backend import FakePlayerBackend  # noqa: E402
+from PyQt6.QtCore import QTimer  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from models.episode import Episode, EpisodeConfig  # noqa: E402
+from services.config_service import ConfigService  # noqa: E402
+from views.video_player import VideoPlayer  # noqa: E402
+from workers.persistence_worker import PersistenceWorker, episodeConfigState  # noqa: E402
+from workers.task_runner import TaskRunner  # noqa: E402
+
+EPISODES = 10000
+EVENTS = 100000
+SKIPS = 1000
+WINDOW = 50
+REPEAT = 5
+SAVE_INTERVAL_MS = 50
+PLAYLIST_KEY = "playlist"
+
+
+class Bench:
+    def __init__(self, app: QApplication, window: int) -> None:
+        self.app = app
+        self.window = window
+        self.player = VideoPlayer(FakePlayerBackend)
+        self.player.setPlaylistWindow(window)
+        self.backend: FakePlayerBackend = self.player.player
+        self.failures: list[str] = []
+
+    def drain(self) -> None:
+        while True:
+            while not self.backend.isIdle():
+                self.app.processEvents()
+            self.app.processEvents()
+            self.player.events.flush()
+            if self.backend.isIdle():
+                return
+
+    def check(self, scenario: str, condition: bool, message: str) -> None:
+        if not condition:
+            self.failures.append(f"{scenario} (window={self.window}): {message}")
+
+    def checkCurrent(self, scenario: str) -> None:
+        config = self.player.episodeConfig
+        position = self.backend.playlistPosition()
+        current = self.backend.playlist[position][0] if position >= 0 else None
+        self.check(
+            scenario,
+            current == config.currentEpisode().path,
+            f"player is on {current!r} but config index {config.index} is {config.currentEpisode().path!r}",
+        )
+
+    def load(self, config: EpisodeConfig) -> float:
+        start = time.perf_counter()
+        self.player.loadEpisodes(config)
+        elapsed = time.perf_counter() - start
+        self.drain()
+        return elapsed
+
+
+def createConfig(count: int, index: int = 0) -> EpisodeConfig:
+    episodes = [
+        Episode(f"Episode {i:05}.mkv", f"/library/Show/Episode {i:05}.mkv", "/library/Show", 0.0, False)
+        for i in range(count)
+    ]
+    for episode in episodes[index + 5 :: 10]:
+        episode.progress = 600.0
+    return EpisodeConfig(index, episodes)
+
+
+def benchmarkLoad(bench: Bench, episodes: int, repeat: int) -> dict[str, float]:
+    times: list[float] = []
+    for i in range(repeat):
+        config = createConfig(episodes, (i * episodes) // max(1, repeat))
+        times.append(bench.load(config) * 1000)
+        bench.checkCurrent("load")
+        expected = config.currentEpisode()
+        started = bench.backend.started[-1] if bench.backend.started else None
+        bench.check("load", started == (expected.path, expected.progress), f"started {started}")
+    return {"median_ms": round(statistics.median(times), 3), "max_ms": round(max(times), 3)}
+
+
+def benchmarkProgress(bench: Bench, episodes: int, events: int, rate: float) -> dict[str, float]:
+    bench.load(createConfig(episodes))
+    before = dict(bench.player.events.counters)
+
+    start = time.perf_counter()
+    bench.backend.playPositions((i * 0.01 for i in range(1, events + 1)), rate)
+    bench.drain()
+    elapsed = time.perf_counter() - start
+
+    progress = bench.player.episodeConfig.currentEpisode().progress
+    bench.check("progress", progress == events * 0.01, f"progress is {progress}")
+    counters = {key: value - before[key] for key, value in bench.player.events.counters.items()}
+    return {"events_per_s": round(events / elapsed), "elapsed_ms": round(elapsed * 1000, 3), **counters}
+
+
+def benchmarkSkipping(bench: Bench, episodes: int, skips: int, rate: float) -> dict[str, float]:
+    config = createConfig(episodes)
+    for episode in config.episodes:
+        episode.progress = 0.0
+    bench.load(config)
+
+    start = time.perf_counter()
+    bench.backend.playPositions((i * 0.5 for i in range(skips * 10)), rate)
+    for _ in range(skips):
+        bench.backend.keypress("n")
+        bench.app.processEvents()
+    bench.drain()
+    elapsed = time.perf_counter() - start
+
+    index = config.index
+    bench.check("skipping", index == skips, f"index is {index}, expected {skips}")
+    skipped = [i for i, e in enumerate(config.episodes[:index]) if not e.completed or e.progress != 0.0]
+    bench.check("skipping", not skipped, f"{len(skipped)} skipped episodes not completed, first {skipped[:5]}")
+    ahead = [i for i, e in enumerate(config.episodes[index + 1 :], index + 1) if e.completed or e.progress != 0.0]
+    bench.check("skipping", not ahead, f"{len(ahead)} episodes ahead were touched, first {ahead[:5]}")
+    bench.checkCurrent("skipping")
+    return {"skips_per_s": round(index / elapsed), "elapsed_ms": round(elapsed * 1000, 3), "lost": skips - index}
+
+
+def benchmarkSaving(bench: Bench, episodes: int, skips: int, interval: int) -> dict[str, float]:
+    config = createConfig(episodes)
+    bench.load(config)
+    configService = ConfigService()
+    runner = TaskRunner(1)
+    persistence = PersistenceWorker(runner)
+    submits: list[float] = []
+    writes = [0]
+    persistence.saved.connect(lambda *_: writes.__setitem__(0, writes[0] + 1))
+
+    with tempfile.TemporaryDirectory(prefix="quickplay-player-") as root:
+        path = os.path.join(root, "playlist.json")
+
+        def submit() -> None:
+            start = time.perf_counter()
+            snapshot = bench.player.episodeConfig.snapshot()
+            persistence.submit(
+                PLAYLIST_KEY,
+                episodeConfigState(snapshot),
+                lambda: configService.saveEpisodeConfig(path, snapshot),
+            )
+            submits.append((time.perf_counter() - start) * 1000)
+
+        timer = QTimer()
+        timer.timeout.connect(submit)
+        timer.start(interval)
+        start = time.perf_counter()
+        for _ in range(skips):
+            bench.backend.playPositions(i * 0.5 for i in range(1, 50))
+            bench.backend.keypress("n")
+            bench.drain()
+        timer.stop()
+        submit()
+        persistence.flush()
+        runner.waitForDone()
+        elapsed = time.perf_counter() - start
+
+        saved = configService.loadEpisodeConfig(path)
+        bench.check(
+            "saving",
+            episodeConfigState(saved) == episodeConfigState(config),
+            f"saved config has index {saved.index}, player has {config.index}",
+        )
+
+    return {
+        "elapsed_ms": round(elapsed * 1000, 3),
+        "submits": len(submits),
+        "writes": writes[0],
+        "submit_median_ms": round(statistics.median(submits), 3),
+        "submit_max_ms": round(max(submits), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stress the player logic against a fake playback backend.")
+    parser.add_argument("--episodes", type=int, default=EPISODES)
+    parser.add_argument("--events", type=int, default=EVENTS)
+    parser.add_argument("--skips", type=int, default=SKIPS)
+    parser.add_argument("--window", type=int, default=WINDOW, help="playlist window for the windowed runs")
+    parser.add_argument("--rate", type=float, default=0.0, help="events per second, 0 replays as fast as possible")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--save-interval", type=int, default=SAVE_INTERVAL_MS)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results: dict[str, dict[str, float]] = {}
+    failures: list[str] = []
+    for window in (0, args.window):
+        bench = Bench(app, window)
+        scenarios = {
+            "loadEpisodes": benchmarkLoad(bench, args.episodes, args.repeat),
+            "progress": benchmarkProgress(bench, args.episodes, args.events, args.rate),
+            "skipping": benchmarkSkipping(bench, args.episodes, args.skips, args.rate),
+            "saving": benchmarkSaving(bench, args.episodes, args.skips, args.save_interval),
+        }
+        for name, result in scenarios.items():
+            key = f"{name}.window{window}"
+            results[key] = result
+            print(f"{key:<22} " + " ".join(f"{k}={v}" for k, v in result.items()))
+        failures.extend(bench.failures)
+        bench.backend.terminate()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps({"results": results, "failures": failures}, indent=2))
+
+    for failure in failures:
+        print(failure)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
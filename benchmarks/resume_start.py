@@ -0,0 +1,80 @@
+import argparse
+import os
+import statistics
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+os.environ["PATH"] = os.path.dirname("./_internal/libmpv-2.dll") + os.pathsep + os.environ["PATH"]
+
+import mpv  # noqa: E402
+import simplejson as json  # noqa: E402
+
+RUNS = 5
+POSITION = 600.0
+TIMEOUT = 60.0
+
+
+def loadThenSeek(player: mpv.MPV, path: str, position: float) -> float:
+    def isResumed(_: object) -> bool:
+        return abs((player.time_pos or 0.0) - position) < 1.0
+
+    start = time.perf_counter()
+    with player.prepare_and_wait_for_event("playback-restart", cond=isResumed, timeout=TIMEOUT):
+        with player.prepare_and_wait_for_event("file-loaded", timeout=TIMEOUT):
+            player.loadfile(path)
+        player.time_pos = position
+    return time.perf_counter() - start
+
+
+def startOption(player: mpv.MPV, path: str, position: float) -> float:
+    start = time.perf_counter()
+    with player.prepare_and_wait_for_event("playback-restart", timeout=TIMEOUT):
+        player.loadfile(path, start=f"{position:.3f}")
+    return time.perf_counter() - start
+
+
+MODES = {"seek": loadThenSeek, "start": startOption}
+
+
+def measure(path: str, position: float, runs: int) -> dict[str, list[float]]:
+    player = mpv.MPV(vo="null", ao="null", pause=True, idle=True, ytdl=False, config=False, load_scripts=False)
+    times: dict[str, list[float]] = {mode: [] for mode in MODES}
+    try:
+        startOption(player, path, position)
+        player.command("stop")
+        for i in range(runs):
+            for mode in list(MODES)[:: 1 if i % 2 == 0 else -1]:
+                times[mode].append(MODES[mode](player, path, position) * 1000)
+                player.command("stop")
+    finally:
+        player.terminate()
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare time to first frame for load-then-seek and start= resume.")
+    parser.add_argument("file")
+    parser.add_argument("--position", type=float, default=POSITION, help="resume position in seconds")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    for mode, times in measure(args.file, args.position, args.runs).items():
+        result = results[mode] = {
+            "mean_ms": round(statistics.fmean(times), 3),
+            "median_ms": round(statistics.median(times), 3),
+            "min_ms": round(min(times), 3),
+            "max_ms": round(max(times), 3),
+        }
+        print(f"{mode:>5}: " + " ".join(f"{key}={value:.1f}" for key, value in result.items()))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            summary = {"file": args.file, "position": args.position, "runs": args.runs, **results}
+            file.write(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "src", "main.py")
+
+RUNS = 10
+TIMEOUT = 60.0
+TIMING = re.compile(r"(\w+)=([\d.]+)ms")
+
+
+def measure(runs: int) -> dict[str, list[float]]:
+    times: dict[str, list[float]] = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, MAIN, "--measure-startup"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=TIMEOUT,
+            check=False,
+        )
+        times.setdefault("process", []).append((time.perf_counter() - start) * 1000)
+
+        line = next((line for line in result.stdout.splitlines() if line.startswith("Startup:")), None)
+        if line is None:
+            print(result.stdout + result.stderr)
+            sys.exit(f"Startup timings missing, exit code {result.returncode}.")
+        for name, milliseconds in TIMING.findall(line):
+            times.setdefault(name, []).append(float(milliseconds))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure time to the first interactive frame over repeated launches.")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    args = parser.parse_args()
+
+    for name, times in measure(args.runs).items():
+        print(f"{name:>12}: median={statistics.median(times):.1f}ms min={min(times):.1f}ms max={max(times):.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
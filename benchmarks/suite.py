@@ -0,0 +1,191 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+
+import simplejson as json  # noqa: E402
+from library import EXTENSIONS, STATUS_FILE, addLibraryArguments, generateLibrary, libraryConfig  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from models.episode import Episode, EpisodeConfig  # noqa: E402
+from models.library_index import LibraryIndex  # noqa: E402
+from models.title import Title  # noqa: E402
+from services.config_service import ConfigService  # noqa: E402
+from services.directory_service import DirectoryService  # noqa: E402
+from services.episode_service import EpisodeService  # noqa: E402
+from utils import getStylesheet  # noqa: E402
+from views.episode_select import EpisodeSelect  # noqa: E402
+from views.title_select import TitleSelect  # noqa: E402
+
+REPEAT = 5
+THRESHOLDS = os.path.join(ROOT, "benchmarks", "thresholds.json")
+
+
+class Suite:
+    def __init__(self, repeat: int) -> None:
+        self.repeat = repeat
+        self.results: dict[str, dict[str, float]] = {}
+
+    def run(self, name: str, function: Callable[[], object], setup: Callable[[], object] | None = None) -> None:
+        times: list[float] = []
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            function()
+            times.append((time.perf_counter() - start) * 1000)
+
+        self.results[name] = {
+            "min_ms": round(min(times), 3),
+            "median_ms": round(statistics.median(times), 3),
+            "max_ms": round(max(times), 3),
+            "runs": len(times),
+        }
+        result = self.results[name]
+        print(f"{name:<32} median={result['median_ms']:>10.3f}ms min={result['min_ms']:.3f}ms")
+
+    def regressions(self, thresholds: dict[str, float]) -> list[str]:
+        failed: list[str] = []
+        for name, limit in thresholds.items():
+            result = self.results.get(name)
+            if result is not None and result["median_ms"] > limit:
+                failed.append(f"{name}: median {result['median_ms']:.3f}ms exceeds {limit:.3f}ms")
+        return failed
+
+
+def benchmarkScanning(suite: Suite, folders: list[str], titles: list[Title]) -> dict[str, list[Episode]]:
+    directoryService = DirectoryService()
+    suite.run("scanTitles.cold", lambda: directoryService.scanTitles(folders, EXTENSIONS, LibraryIndex()))
+
+    index = LibraryIndex()
+    directoryService.scanTitles(folders, EXTENSIONS, index)
+    suite.run("scanTitles.indexed", lambda: directoryService.scanTitles(folders, EXTENSIONS, index))
+
+    def scanEpisodes(index: LibraryIndex | None) -> dict[str, list[Episode]]:
+        return {os.path.join(t.base, t.name): directoryService.scanEpisodes(t, EXTENSIONS, index) for t in titles}
+
+    suite.run("scanEpisodes.cold", lambda: scanEpisodes(None))
+    suite.run("scanEpisodes.indexed", lambda: scanEpisodes(index))
+    return scanEpisodes(index)
+
+
+def benchmarkStatus(suite: Suite, scanned: dict[str, list[Episode]]) -> None:
+    episodeService = EpisodeService()
+    statusFiles = {d: os.path.join(d, STATUS_FILE) for d in scanned if os.path.isfile(os.path.join(d, STATUS_FILE))}
+    loaded: dict[str, list[Episode]] = {}
+
+    def load() -> None:
+        for directory, path in statusFiles.items():
+            loaded[directory] = episodeService.load(path)
+
+    def save() -> None:
+        for directory, path in statusFiles.items():
+            episodeService.save(path, loaded[directory])
+
+    def match() -> None:
+        for directory in statusFiles:
+            loaded[directory] = episodeService.matchEpisodes(scanned[directory], loaded[directory])
+
+    suite.run("EpisodeService.load", load)
+    suite.run("EpisodeService.save", save)
+    suite.run("EpisodeService.matchEpisodes", match)
+
+
+def benchmarkPlaylist(suite: Suite, root: str, scanned: dict[str, list[Episode]]) -> None:
+    configService = ConfigService()
+    path = os.path.join(root, "playlist.json")
+    config = EpisodeConfig(0, [e for episodes in scanned.values() for e in episodes])
+
+    def save() -> None:
+        config.index = (config.index + 1) % len(config.episodes)
+        config.currentEpisode().progress += 1.0
+        configService.saveEpisodeConfig(path, config)
+
+    suite.run("ConfigService.saveEpisodeConfig", save)
+    suite.run("ConfigService.loadEpisodeConfig", lambda: configService.loadEpisodeConfig(path))
+
+
+def benchmarkViews(suite: Suite, titles: list[Title], scanned: dict[str, list[Episode]]) -> None:
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    app.setStyleSheet(getStylesheet("_internal/styles.qss"))
+    episodes = [e for episodes in scanned.values() for e in episodes]
+
+    titleSelect = TitleSelect(None)
+    episodeSelect = EpisodeSelect(None)
+    titleSelect.show()
+    episodeSelect.show()
+
+    def setTitles() -> None:
+        titleSelect.setTitles(titles)
+        app.processEvents()
+
+    def setEpisodes() -> None:
+        episodeSelect.setEpisodes(episodes)
+        app.processEvents()
+
+    suite.run("TitleSelect.setTitles", setTitles, lambda: titleSelect.setTitles([]))
+    suite.run("EpisodeSelect.setEpisodes", setEpisodes, lambda: episodeSelect.setEpisodes([]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the library benchmark suite on a synthetic library.")
+    addLibraryArguments(parser)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--thresholds", default=THRESHOLDS, help="JSON file of maximum median times in ms")
+    parser.add_argument("--no-thresholds", action="store_true")
+    args = parser.parse_args()
+
+    config = libraryConfig(args)
+    library = asdict(config)
+    suite = Suite(args.repeat)
+    with tempfile.TemporaryDirectory(prefix="quickplay-bench-") as root:
+        start = time.perf_counter()
+        folders, titles = generateLibrary(root, config)
+        print(f"generated {len(titles)} titles x {config.episodes} episodes in {time.perf_counter() - start:.2f}s")
+
+        scanned = benchmarkScanning(suite, folders, titles)
+        benchmarkStatus(suite, scanned)
+        benchmarkPlaylist(suite, root, scanned)
+        benchmarkViews(suite, titles, scanned)
+
+    thresholds: dict[str, float] = {}
+    if not args.no_thresholds and os.path.isfile(args.thresholds):
+        with open(args.thresholds, "r", encoding="utf-8") as file:
+            data = json.loads(file.read())
+        if data["library"] == library:
+            thresholds = data["max_median_ms"]
+        else:
+            print(f"Skipping thresholds from '{args.thresholds}', they were set for {data['library']}.")
+    regressions = suite.regressions(thresholds)
+
+    output = {
+        "library": library,
+        "repeat": args.repeat,
+        "results": suite.results,
+        "thresholds": thresholds,
+        "regressions": regressions,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps(output, indent=2))
+
+    for regression in regressions:
+        print(regression)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ a = Analysis(
         ("./_internal/styles.qss", "."),
         ("./_internal/icons", "icons"),
     ],
-    hiddenimports=[],
+    hiddenimports=["mpv"],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
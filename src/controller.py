@@ -1,14 +1,40 @@
 import os
+from collections.abc import Callable, Iterator
+from contextlib import closing
 
+from PyQt6.QtCore import QSize, QTimer
 from PyQt6.QtWidgets import QApplication
 
+import tracing
 from models.episode import Episode, EpisodeConfig
+from models.library_index import LibraryIndex
+from models.media_info import MediaInfo
 from models.page import Page
 from models.title import Title
 from services.config_service import ConfigService
 from services.directory_service import DirectoryService
 from services.episode_service import EpisodeService
+from services.index_service import IndexService
+from services.mpv_loader import loadMpv
+from services.progress_store import JsonProgressStore
+from services.sqlite_progress_store import SqliteProgressStore
+from utils import iterBatches, loadImage
 from views.main_window import MainWindow
+from views.video_player import VideoPlayer
+from workers.library_watcher import LibraryWatcher
+from workers.persistence_worker import PersistenceWorker, episodeConfigState, episodeState
+from workers.prefetcher import Prefetcher
+from workers.task_runner import Task, TaskRunner
+
+TITLE_BATCH_SIZE = 200
+TITLE_BATCH_INTERVAL = 0.05
+CHECKPOINT_INTERVAL_MS = 5000
+METADATA_BATCH_SIZE = 50
+METADATA_BATCH_INTERVAL = 0.25
+DURATION_PROBE_CHUNK = 2
+THUMBNAIL_BATCH_SIZE = 20
+THUMBNAIL_BATCH_INTERVAL = 0.1
+PLAYLIST_KEY = "playlist"
 
 
 class QuickplayController:
@@ -18,58 +44,403 @@ class QuickplayController:
         directoryService: DirectoryService,
         configService: ConfigService,
         episodeService: EpisodeService,
+        indexService: IndexService,
     ) -> None:
         self._view = view
         self._directoryService = directoryService
         self._configService = configService
         self._episodeService = episodeService
-        self._config = self._configService.loadAppConfig()
+        self._indexService = indexService
+        self._scanTasks = TaskRunner()
+        self._ioTasks = TaskRunner(1)
+        self._titleTask: Task | None = None
+        self._episodeTask: Task | None = None
+        self._metadataTask: Task | None = None
+        self._durationTask: Task | None = None
+        self._thumbnailTasks: dict[Page, Task] = {}
+        self._watcher = LibraryWatcher(self._scanTasks)
+        self._persistence = PersistenceWorker(self._ioTasks)
+        self._checkpointTimer = QTimer()
+        self._checkpointTimer.setInterval(CHECKPOINT_INTERVAL_MS)
+        self._openTitle: Title | None = None
+        self._titles: dict[str, Title] = {}
+        self._candidates: dict[str, Title] = {}
+        self._legacyStore: JsonProgressStore | None = None
 
-        self._view.titleSelect.startPreviousDisabled.emit(not os.path.isfile(self._config.playlistFile))
-        titles = self._directoryService.scanTitles(self._config.folders, self._config.extensions)
-        self._view.titleSelect.setTitles(titles)
+    @tracing.traced("controller.start")
+    def start(self) -> None:
+        self._config = self._configService.loadAppConfig()
+        self._index = self._indexService.load(self._config.indexFile)
+        self._store = self._configService.createProgressStore(self._config)
+        self._configService.setStore(self._store)
+        self._episodeService.setStore(self._store)
+        self._episodeService.loadMetadata(self._config.metadataFile)
+        self._episodeService.setThumbnailCache(self._config.thumbnailDirectory, self._config.thumbnailCacheSize)
+        self._prefetcher = Prefetcher(
+            self._scanTasks, self._config.prefetchLead, self._config.prefetchHeadBytes, self._config.prefetchTailBytes
+        )
 
+        self._view.titleSelect.startPreviousDisabled.emit(
+            not self._configService.hasEpisodeConfig(self._config.playlistFile)
+        )
         self._connectSignals()
+        self._watcher.setIgnored([self._config.statusFile])
+        self._watcher.setFolders(self._config.folders)
+        if isinstance(self._store, SqliteProgressStore) and self._store.needsImport():
+            self._legacyStore = JsonProgressStore()
+        self._scanTitles(reconcile=True, importProgress=self._legacyStore is not None)
+        self._scanTasks.start(lambda _: loadMpv())
 
     def _connectSignals(self) -> None:
         self._view.titleSelect.titleSelected.connect(self._onTitleSelected)
         self._view.titleSelect.startPreviousClicked.connect(self._onStartPrevious)
+        self._view.titleSelect.rescanClicked.connect(self._onRescan)
+        self._view.titleSelect.thumbnailsRequested.connect(self._onTitleThumbnailsRequested)
+        self._view.episodeSelect.thumbnailsRequested.connect(self._onEpisodeThumbnailsRequested)
+        self._view.episodeSelect.mediaInfoRequested.connect(self._onMediaInfoRequested)
+        self._view.episodeSelect.durationsRequested.connect(self._onDurationsRequested)
         self._view.episodeSelect.backClicked.connect(self._onBackToTitles)
         self._view.episodeSelect.episodesSelected.connect(self._onEpisodesSelected)
         self._view.playerPage.stopRequested.connect(self._onStopPlayback)
-        self._view.playerPage.player.quitEvent.connect(self._onStopPlayback)
-        self._view.playerPage.player.isFullscreen.connect(self._onFullscreen)
-        QApplication.instance().aboutToQuit.connect(self._saveConfig)
+        self._view.playerPage.playerCreated.connect(self._onPlayerCreated)
+        self._watcher.foldersChanged.connect(self._onFoldersChanged)
+        self._watcher.candidatesChanged.connect(self._onCandidatesChanged)
+        self._watcher.titleChanged.connect(self._onOpenTitleChanged)
+        self._persistence.saved.connect(self._onSaved)
+        self._checkpointTimer.timeout.connect(self._submitPlayback)
+        QApplication.instance().aboutToQuit.connect(self._onQuit)
+
+    def _onPlayerCreated(self, player: VideoPlayer) -> None:
+        player.setEventInterval(self._config.eventInterval)
+        player.setPlaylistWindow(self._config.playlistWindow)
+        player.quitEvent.connect(self._onStopPlayback)
+        player.isFullscreen.connect(self._onFullscreen)
+        player.remainingChanged.connect(self._onRemainingChanged)
+
+    def _scanTitles(self, reconcile: bool = False, importProgress: bool = False) -> None:
+        if self._titleTask is not None:
+            self._titleTask.cancel()
+
+        index = self._index
+        self._view.titleSelect.setTitles([])
+        self._titles = {}
+        self._view.titleSelect.setBusy(True)
+        self._titleTask = self._scanTasks.start(lambda task: self._runTitleScan(task, index))
+        self._titleTask.batch.connect(self._addTitles)
+        self._titleTask.progress.connect(self._view.titleSelect.setProgress)
+        self._titleTask.done.connect(lambda: self._view.titleSelect.setBusy(False))
+        if importProgress:
+            self._titleTask.finished.connect(self._importProgress)
+        if reconcile:
+            self._titleTask.finished.connect(self._reconcileLibrary)
+
+    def _runTitleScan(self, task: Task, index: LibraryIndex) -> list[Title]:
+        scanned: list[Title] = []
+        titles = self._directoryService.iterTitles(
+            self._config.folders, self._config.extensions, index, task.reportProgress
+        )
+        with closing(titles), tracing.span("scanTitles"):
+            for batch in iterBatches(titles, TITLE_BATCH_SIZE, TITLE_BATCH_INTERVAL):
+                task.checkCancelled()
+                task.reportBatch(batch)
+                scanned.extend(batch)
+        self._saveIndex(index)
+        return scanned
+
+    def _reconcileLibrary(self, titles: list[Title]) -> None:
+        self._view.titleSelect.setBusy(True)
+        task = self._scanTasks.start(lambda task: self._scanLibrary(task, titles))
+        task.progress.connect(self._view.titleSelect.setProgress)
+        task.finished.connect(self._matchLibrary)
+        task.done.connect(lambda: self._view.titleSelect.setBusy(False))
+
+    def _scanLibrary(self, task: Task, titles: list[Title]) -> dict[str, list[Episode]]:
+        library: dict[str, list[Episode]] = {}
+        for i, title in enumerate(titles):
+            task.checkCancelled()
+            task.reportProgress(i, len(titles))
+            statusFilePath = os.path.join(title.base, title.name, self._config.statusFile)
+            library[statusFilePath] = self._directoryService.scanEpisodes(title, self._config.extensions, self._index)
+        return library
+
+    def _matchLibrary(self, scanned: dict[str, list[Episode]]) -> None:
+        self._ioTasks.start(lambda task: self._runLibraryReconcile(task, scanned))
+
+    def _runLibraryReconcile(self, task: Task, scanned: dict[str, list[Episode]]) -> None:
+        statuses = self._episodeService.loadLibrary(list(scanned))
+        library = {path: (episodes, statuses.get(path, [])) for path, episodes in scanned.items()}
+        matched = self._episodeService.matchLibrary(library)
+        task.checkCancelled()
+        self._episodeService.saveLibrary({p: e for p, e in matched.items() if e != statuses.get(p, library[p][0])})
+
+    def _importProgress(self, titles: list[Title]) -> None:
+        statusFilePaths = [os.path.join(t.base, t.name, self._config.statusFile) for t in titles]
+        task = self._ioTasks.start(
+            lambda task: self._importLegacy(statusFilePaths, [self._config.playlistFile], task.isCancelled)
+        )
+        task.finished.connect(self._onProgressImported)
+
+    def _importLegacy(
+        self, statusFilePaths: list[str], playlistPaths: list[str], isCancelled: Callable[[], bool] | None = None
+    ) -> None:
+        legacyStore = self._legacyStore
+        if legacyStore is not None:
+            legacyStore.copyTo(self._store, statusFilePaths, playlistPaths, isCancelled)
+
+    def _onProgressImported(self) -> None:
+        self._legacyStore = None
+        self._store.markImported()
+        self._view.titleSelect.startPreviousDisabled.emit(
+            not self._configService.hasEpisodeConfig(self._config.playlistFile)
+        )
+
+    def _saveIndex(self, index: LibraryIndex) -> None:
+        if index.changed:
+            self._indexService.save(self._config.indexFile, index)
+
+    def _onRescan(self) -> None:
+        self._index = LibraryIndex()
+        self._scanTitles(reconcile=True)
+
+    def _onFoldersChanged(self, folders: list[str]) -> None:
+        index = self._index
+        extensions = self._config.extensions
+        task = self._scanTasks.start(
+            lambda _: [self._directoryService.updateFolder(folder, extensions, index) for folder in folders]
+        )
+        task.finished.connect(self._applyFolderChanges)
+
+    def _applyFolderChanges(self, changes: list[tuple[list[Title], list[Title], list[Title]]]) -> None:
+        for added, removed, empty in changes:
+            self._removeTitles(removed)
+            self._removeCandidates(removed)
+            titles = [t for t in added if os.path.join(t.base, t.name) not in self._titles]
+            self._removeCandidates(titles)
+            self._addTitles(titles)
+            self._removeTitles([t for t in empty if os.path.join(t.base, t.name) in self._titles])
+            self._addCandidates([t for t in empty if os.path.join(t.base, t.name) not in self._candidates])
+
+    def _onCandidatesChanged(self, paths: list[str]) -> None:
+        index = self._index
+        extensions = self._config.extensions
+        candidates = [self._candidates[path] for path in paths if path in self._candidates]
+        task = self._scanTasks.start(
+            lambda _: [t for t in candidates if self._directoryService.hasEpisodes(t, extensions, index)]
+        )
+        task.finished.connect(self._applyCandidateChanges)
+
+    def _applyCandidateChanges(self, titles: list[Title]) -> None:
+        self._addTitles(titles)
+        self._removeCandidates(titles)
+
+    def _addTitles(self, titles: list[Title]) -> None:
+        self._view.titleSelect.appendTitles(titles)
+        self._titles.update({os.path.join(t.base, t.name): t for t in titles})
+
+    def _removeTitles(self, titles: list[Title]) -> None:
+        self._view.titleSelect.removeTitles(titles)
+        for title in titles:
+            self._titles.pop(os.path.join(title.base, title.name), None)
+
+    def _addCandidates(self, titles: list[Title]) -> None:
+        self._candidates.update({os.path.join(t.base, t.name): t for t in titles})
+        self._watcher.addCandidates([os.path.join(t.base, t.name) for t in titles])
+
+    def _removeCandidates(self, titles: list[Title]) -> None:
+        paths = [os.path.join(t.base, t.name) for t in titles]
+        for path in paths:
+            self._candidates.pop(path, None)
+        self._watcher.removeCandidates(paths)
+
+    def _onOpenTitleChanged(self, path: str) -> None:
+        title = self._openTitle
+        if title is None or self._episodeTask is not None:
+            return
+
+        task = self._ioTasks.start(lambda task: self._loadEpisodes(task, title))
+        task.finished.connect(self._view.episodeSelect.updateEpisodes)
 
     def _onTitleSelected(self, title: Title) -> None:
-        episodes = self._directoryService.scanEpisodes(title, self._config.extensions)
+        self._cancelEpisodeTask()
+        self._openTitle = title
+        self._watcher.setTitle(os.path.join(title.base, title.name))
+        self._view.episodeSelect.setEpisodes([])
+        self._view.episodeSelect.setBusy(True)
+        self._view.setPage(Page.EPISODES)
+
+        self._episodeTask = self._ioTasks.start(lambda task: self._loadEpisodes(task, title))
+        self._episodeTask.finished.connect(self._view.episodeSelect.setEpisodes)
+        self._episodeTask.done.connect(self._onEpisodesLoaded)
+
+    def _onEpisodesLoaded(self) -> None:
+        self._episodeTask = None
+        self._view.episodeSelect.setBusy(False)
+
+    def _loadEpisodes(self, task: Task, title: Title) -> list[Episode]:
+        episodes = self._directoryService.scanEpisodes(title, self._config.extensions, self._index)
+        task.checkCancelled()
 
         statusFilePath = os.path.join(title.base, title.name, self._config.statusFile)
-        if os.path.isfile(statusFilePath):
+        self._importLegacy([statusFilePath], [])
+        savedState = None
+        orphans: list[Episode] = []
+        if self._episodeService.exists(statusFilePath):
             statusEpisodes = self._episodeService.load(statusFilePath)
+            savedState = episodeState(statusEpisodes)
             episodes = self._episodeService.matchEpisodes(episodes, statusEpisodes)
-        self._episodeService.save(statusFilePath, episodes)
+            orphans = self._episodeService.orphans(episodes, statusEpisodes)
+        task.checkCancelled()
+        if episodeState(episodes + orphans) != savedState:
+            self._episodeService.save(statusFilePath, episodes + orphans)
+        return episodes
 
-        self._view.episodeSelect.setEpisodes(episodes)
-        self._view.setPage(Page.EPISODES)
+    def _cancelEpisodeTask(self) -> None:
+        if self._episodeTask is not None:
+            self._episodeTask.cancel()
+            self._episodeTask = None
+        if self._metadataTask is not None:
+            self._metadataTask.cancel()
+            self._metadataTask = None
+        if self._durationTask is not None:
+            self._durationTask.cancel()
+            self._durationTask = None
+
+    def _onMediaInfoRequested(self, episodes: list[Episode]) -> None:
+        if self._metadataTask is not None:
+            self._metadataTask.cancel()
+            self._metadataTask = None
+        if not episodes:
+            return
+
+        paths = [e.path for e in episodes]
+        self._metadataTask = self._scanTasks.start(lambda task: self._runMetadataProbe(task, paths))
+        self._metadataTask.batch.connect(self._view.episodeSelect.setMediaInfo)
+        self._metadataTask.finished.connect(self._saveMetadata)
+
+    def _runMetadataProbe(self, task: Task, paths: list[str]) -> None:
+        cached, missing = self._episodeService.lookupMetadata(paths)
+        if cached:
+            task.reportBatch(list(cached.items()))
+
+        with closing(self._episodeService.probeMetadata(missing, task.isCancelled)) as results:
+            for batch in iterBatches(results, METADATA_BATCH_SIZE, METADATA_BATCH_INTERVAL):
+                task.checkCancelled()
+                task.reportBatch(batch)
+
+    def _onDurationsRequested(self, episodes: list[Episode]) -> None:
+        if self._durationTask is not None:
+            self._durationTask.cancel()
+            self._durationTask = None
+        if not episodes:
+            return
+
+        paths = [e.path for e in episodes]
+        self._durationTask = self._scanTasks.start(lambda task: self._runDurationProbe(task, paths))
+        self._durationTask.batch.connect(self._view.episodeSelect.setMediaInfo)
+        self._durationTask.finished.connect(self._saveMetadata)
+
+    def _runDurationProbe(self, task: Task, paths: list[str]) -> None:
+        cached, missing = self._episodeService.lookupMetadata(paths)
+        if cached:
+            task.reportBatch(list(cached.items()))
+
+        results = self._probeInChunks(missing, task)
+        with closing(results):
+            for batch in iterBatches(results, METADATA_BATCH_SIZE, METADATA_BATCH_INTERVAL):
+                task.checkCancelled()
+                task.reportBatch(batch)
+
+    def _probeInChunks(self, paths: list[str], task: Task) -> Iterator[tuple[str, MediaInfo | None]]:
+        for start in range(0, len(paths), DURATION_PROBE_CHUNK):
+            task.checkCancelled()
+            cached, missing = self._episodeService.lookupMetadata(paths[start : start + DURATION_PROBE_CHUNK])
+            yield from cached.items()
+            with closing(self._episodeService.probeMetadata(missing, task.isCancelled)) as results:
+                yield from results
+
+    def _saveMetadata(self) -> None:
+        self._ioTasks.start(lambda _: self._episodeService.saveMetadata(self._config.metadataFile))
+
+    def _onTitleThumbnailsRequested(self, titles: list[Title], size: QSize) -> None:
+        self._cancelThumbnails(Page.TITLES)
+        if not titles:
+            return
+
+        index = self._index
+        task = self._scanTasks.start(lambda task: self._runTitleThumbnails(task, titles, size, index))
+        task.batch.connect(self._view.titleSelect.setThumbnails)
+        self._thumbnailTasks[Page.TITLES] = task
+
+    def _onEpisodeThumbnailsRequested(self, episodes: list[Episode], size: QSize) -> None:
+        self._cancelThumbnails(Page.EPISODES)
+        if not episodes:
+            return
+
+        sources: dict[str, list[object]] = {}
+        for e in episodes:
+            sources.setdefault(e.path, []).append(e)
+        task = self._scanTasks.start(lambda task: self._runThumbnails(task, sources, size))
+        task.batch.connect(self._view.episodeSelect.setThumbnails)
+        self._thumbnailTasks[Page.EPISODES] = task
+
+    def _cancelThumbnails(self, page: Page) -> None:
+        task = self._thumbnailTasks.pop(page, None)
+        if task is not None:
+            task.cancel()
+
+    def _runTitleThumbnails(self, task: Task, titles: list[Title], size: QSize, index: LibraryIndex) -> None:
+        sources: dict[str, list[object]] = {}
+        missing: list[tuple[object, None]] = []
+        for title in titles:
+            episodes = self._directoryService.scanEpisodes(title, self._config.extensions, index)
+            if episodes:
+                sources.setdefault(min(e.path for e in episodes), []).append(title)
+            else:
+                missing.append((title, None))
+        if missing:
+            task.reportBatch(missing)
+        self._runThumbnails(task, sources, size)
+
+    def _runThumbnails(self, task: Task, sources: dict[str, list[object]], size: QSize) -> None:
+        with closing(self._episodeService.thumbnails(list(sources), task.isCancelled)) as results:
+            for batch in iterBatches(results, THUMBNAIL_BATCH_SIZE, THUMBNAIL_BATCH_INTERVAL):
+                task.checkCancelled()
+                images = [(path, loadImage(target, size) if target is not None else None) for path, target in batch]
+                task.reportBatch([(item, image) for path, image in images for item in sources[path]])
 
     def _onStartPrevious(self) -> None:
-        config = self._configService.loadEpisodeConfig(self._config.playlistFile)
+        task = self._ioTasks.start(lambda _: self._loadEpisodeConfig(self._config.playlistFile))
+        task.finished.connect(self._onEpisodeConfigLoaded)
+
+    def _loadEpisodeConfig(self, path: str) -> EpisodeConfig:
+        self._importLegacy([], [path])
+        return self._configService.loadEpisodeConfig(path)
+
+    def _onEpisodeConfigLoaded(self, config: EpisodeConfig) -> None:
+        self._persistence.markClean(PLAYLIST_KEY, episodeConfigState(config))
         self._startPlayback(config)
 
     def _onEpisodesSelected(self, episodes: list[Episode]) -> None:
         config = EpisodeConfig(0, episodes)
-        self._configService.saveEpisodeConfig(self._config.playlistFile, config)
+        self._submitEpisodeConfig(config.snapshot(), immediate=True)
         self._view.titleSelect.startPreviousDisabled.emit(False)
         self._startPlayback(config)
 
     def _startPlayback(self, config: EpisodeConfig) -> None:
-        self._view.playerPage.player.loadEpisodes(config)
+        player = self._view.playerPage.ensurePlayer()
+        player.loadEpisodes(config)
         self._view.setPage(Page.PLAYER)
-        self._view.playerPage.player.start()
+        player.start()
+        self._checkpointTimer.start()
+
+    def _onRemainingChanged(self, remaining: float) -> None:
+        config = self._view.playerPage.player.episodeConfig
+        self._prefetcher.update(config.episodes, config.index, remaining)
 
     def _onStopPlayback(self) -> None:
         self._view.playerPage.player.stop()
+        self._prefetcher.cancel()
+        self._checkpointTimer.stop()
         self._saveConfig()
         self._onFullscreen(False)
         if self._view.titleSelect.hasSelection():
@@ -86,20 +457,70 @@ class QuickplayController:
             self._view.playerPage.setControlsVisible(True)
 
     def _onBackToTitles(self) -> None:
+        self._cancelEpisodeTask()
+        self._openTitle = None
+        self._watcher.setTitle(None)
         self._view.setPage(Page.TITLES)
 
+    def _onQuit(self) -> None:
+        self._checkpointTimer.stop()
+        self._cancelEpisodeTask()
+        self._scanTasks.cancelAll()
+        self._ioTasks.cancelAll()
+        self._saveConfig()
+        self._persistence.flush()
+
+        self._scanTasks.waitForDone()
+        self._saveIndex(self._index)
+        self._episodeService.saveMetadata(self._config.metadataFile)
+        self._episodeService.close()
+        self._store.close()
+
     def _saveConfig(self) -> None:
-        try:
-            episodeConfig = self._view.playerPage.player.episodeConfig
-            self._configService.saveEpisodeConfig(self._config.playlistFile, episodeConfig)
+        if self._submitPlayback(immediate=True):
             self._view.titleSelect.startPreviousDisabled.emit(False)
 
-            episodes = episodeConfig.episodes
-            statusFilePath = os.path.join(episodes[0].base, self._config.statusFile)
-            if os.path.isfile(statusFilePath):
-                statusEpisodes = self._episodeService.load(statusFilePath)
-                episodes = self._episodeService.matchEpisodes(statusEpisodes, episodes)
-            self._episodeService.save(statusFilePath, episodes)
-            self._view.episodeSelect.setEpisodes(episodes)
+    def _submitPlayback(self, immediate: bool = False) -> bool:
+        try:
+            snapshot = self._view.playerPage.player.episodeConfig.snapshot()
         except AttributeError:
             print("Skipping config save.")
+            return False
+
+        self._submitEpisodeConfig(snapshot, immediate)
+        statusFilePath = os.path.join(snapshot.episodes[0].base, self._config.statusFile)
+        self._persistence.submit(
+            statusFilePath,
+            episodeState(snapshot.episodes),
+            lambda: self._saveStatus(statusFilePath, snapshot.episodes),
+            immediate,
+        )
+        return True
+
+    def _submitEpisodeConfig(self, config: EpisodeConfig, immediate: bool = False) -> None:
+        self._persistence.submit(
+            PLAYLIST_KEY,
+            episodeConfigState(config),
+            lambda: self._configService.saveEpisodeConfig(self._config.playlistFile, config),
+            immediate,
+        )
+
+    def _saveStatus(self, statusFilePath: str, played: list[Episode]) -> list[Episode]:
+        self._importLegacy([statusFilePath], [])
+        if not self._episodeService.exists(statusFilePath):
+            self._episodeService.save(statusFilePath, played)
+            return played
+
+        statusEpisodes = self._episodeService.load(statusFilePath)
+        savedState = episodeState(statusEpisodes)
+        episodes = self._episodeService.matchEpisodes(statusEpisodes, played)
+        if episodeState(episodes) != savedState:
+            self._episodeService.save(statusFilePath, episodes)
+        return episodes
+
+    def _onSaved(self, key: str, result: object) -> None:
+        title = self._openTitle
+        if title is None or key == PLAYLIST_KEY:
+            return
+        if key == os.path.join(title.base, title.name, self._config.statusFile):
+            self._view.episodeSelect.updateEpisodes(result)
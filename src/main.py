@@ -1,33 +1,61 @@
+import argparse
 import locale
+import multiprocessing
 import sys
+import time
 
 from PyQt6.QtWidgets import QApplication
 
+import tracing
 from controller import QuickplayController
 from services.config_service import ConfigService
 from services.directory_service import DirectoryService
 from services.episode_service import EpisodeService
+from services.index_service import IndexService
 from utils import getStylesheet
 from views.main_window import MainWindow
+from workers.startup_sequence import StartupSequence
+
+STYLESHEET = "_internal/styles.qss"
 
 
 def main() -> None:
+    started = time.perf_counter()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trace", nargs="?", const=tracing.TRACE_FILE, help="write a Chrome trace on exit")
+    parser.add_argument("--measure-startup", action="store_true", help="print startup timings and exit when ready")
+    args, qtArgs = parser.parse_known_args()
+    tracing.enableFromEnvironment()
+    if args.trace is not None:
+        tracing.enable(args.trace)
+
     locale.setlocale(locale.LC_NUMERIC, "C")
 
-    app = QApplication(sys.argv)
-    app.setStyleSheet(getStylesheet("_internal/styles.qss"))
+    app = QApplication([sys.argv[0], *qtArgs])
+    app.setStyleSheet(getStylesheet(STYLESHEET))
 
     view = MainWindow()
-    view.show()
 
     directoryService = DirectoryService()
     configService = ConfigService()
     episodeService = EpisodeService()
+    indexService = IndexService()
 
-    _controller = QuickplayController(view, directoryService, configService, episodeService)
+    controller = QuickplayController(view, directoryService, configService, episodeService, indexService)
+
+    startup = StartupSequence(view, started)
+    startup.addStage("icon", view.loadIcon)
+    startup.addStage("controller", controller.start)
+    if args.measure_startup:
+        startup.finished.connect(lambda: print(f"Startup: {startup.summary()}"))
+        startup.finished.connect(app.quit)
+    view.show()
 
-    sys.exit(app.exec())
+    status = app.exec()
+    tracing.report()
+    sys.exit(status)
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -7,3 +7,14 @@ class AppConfig:
     statusFile: str
     folders: list[str]
     extensions: list[str]
+    indexFile: str = "_internal/index.json"
+    storage: str = "json"
+    databaseFile: str = "_internal/quickplay.db"
+    metadataFile: str = "_internal/metadata.json"
+    thumbnailDirectory: str = "_internal/thumbnails"
+    thumbnailCacheSize: int = 256 * 1024 * 1024
+    eventInterval: int = 250
+    playlistWindow: int = 0
+    prefetchLead: float = 30.0
+    prefetchHeadBytes: int = 16 * 1024 * 1024
+    prefetchTailBytes: int = 4 * 1024 * 1024
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 @dataclass
@@ -8,6 +8,7 @@ class Episode:
     base: str
     progress: float
     completed: bool
+    fingerprint: str | None = None
 
 
 @dataclass
@@ -17,3 +18,6 @@ class EpisodeConfig:
 
     def currentEpisode(self) -> Episode:
         return self.episodes[self.index]
+
+    def snapshot(self) -> "EpisodeConfig":
+        return EpisodeConfig(self.index, [replace(e) for e in self.episodes])
@@ -0,0 +1,22 @@
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class IndexedFolder:
+    mtime: int
+    directories: list[str]
+
+
+@dataclass
+class IndexedDirectory:
+    mtime: int
+    files: list[str]
+
+
+@dataclass
+class LibraryIndex:
+    folders: dict[str, IndexedFolder] = field(default_factory=dict)
+    directories: dict[str, IndexedDirectory] = field(default_factory=dict)
+    changed: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
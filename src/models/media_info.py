@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MediaInfo:
+    duration: float
+    chapters: list[float] = field(default_factory=list)
+    videoCodec: str | None = None
+    width: int | None = None
+    height: int | None = None
+    audioTracks: int = 0
+    subtitleTracks: int = 0
+
+
+@dataclass
+class CachedMediaInfo:
+    size: int
+    mtime: int
+    info: MediaInfo | None
@@ -3,12 +3,26 @@ import os
 import simplejson as json
 
 from models.app_config import AppConfig
-from models.episode import Episode, EpisodeConfig
+from models.episode import EpisodeConfig
+from services.progress_store import JsonProgressStore, ProgressStore
+from services.sqlite_progress_store import SqliteProgressStore
+from utils import atomicWrite
 
 APP_CONFIG_PATH = "_internal/config.json"
 
 
 class ConfigService:
+    def __init__(self) -> None:
+        self._store: ProgressStore = JsonProgressStore()
+
+    def setStore(self, store: ProgressStore) -> None:
+        self._store = store
+
+    def createProgressStore(self, config: AppConfig) -> ProgressStore:
+        if config.storage == "sqlite":
+            return SqliteProgressStore(config.databaseFile)
+        return JsonProgressStore()
+
     def loadAppConfig(self) -> AppConfig:
         if os.path.isfile(APP_CONFIG_PATH):
             with open(APP_CONFIG_PATH, "r", encoding="utf-8") as file:
@@ -20,17 +34,14 @@ class ConfigService:
             return config
 
     def saveAppConfig(self, config: AppConfig) -> None:
-        with open(APP_CONFIG_PATH, "w", encoding="utf-8") as file:
-            data = config.__dict__
-            file.write(json.dumps(data, indent=2))
+        data = config.__dict__
+        atomicWrite(APP_CONFIG_PATH, json.dumps(data, indent=2))
+
+    def hasEpisodeConfig(self, path: str) -> bool:
+        return self._store.hasEpisodeConfig(path)
 
     def loadEpisodeConfig(self, path: str) -> EpisodeConfig:
-        with open(path, "r", encoding="utf-8") as file:
-            data = json.loads(file.read())
-            episodes = [Episode(**e) for e in data["episodes"]]
-            return EpisodeConfig(data["index"], episodes)
+        return self._store.loadEpisodeConfig(path)
 
     def saveEpisodeConfig(self, path: str, config: EpisodeConfig) -> None:
-        with open(path, "w", encoding="utf-8") as file:
-            data = {"index": config.index, "episodes": [e.__dict__ for e in config.episodes]}
-            file.write(json.dumps(data, indent=2))
+        self._store.saveEpisodeConfig(path, config)
@@ -1,42 +1,143 @@
 import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from models.episode import Episode
+from models.library_index import IndexedDirectory, IndexedFolder, LibraryIndex
 from models.title import Title
+from tracing import traced
+
+SCAN_WORKERS = 8
 
 
 class DirectoryService:
-    def scanTitles(self, folders: list[str], extensions: list[str]) -> list[Title]:
-        titles: list[Title] = []
+    def scanTitles(self, folders: list[str], extensions: list[str], index: LibraryIndex | None = None) -> list[Title]:
+        return list(self.iterTitles(folders, extensions, index))
 
-        for folder in folders:
-            if not os.path.isdir(folder):
-                print(f"Failed to find directory '{folder}'!")
-                continue
+    def iterTitles(
+        self,
+        folders: list[str],
+        extensions: list[str],
+        index: LibraryIndex | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> Iterator[Title]:
+        if index is None:
+            index = LibraryIndex()
 
-            directories = os.listdir(folder)
+        executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="scan")
+        pending: dict[Future, tuple[str, str | None]] = {}
+        completed = 0
+        try:
+            for folder in folders:
+                pending[executor.submit(self._listDirectories, folder, index)] = (folder, None)
 
-            for directory in directories:
-                path = os.path.join(folder, directory)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, directory = pending.pop(future)
+                    if directory is None:
+                        for entry in future.result():
+                            path = os.path.join(folder, entry)
+                            pending[executor.submit(self._listFiles, path, index)] = (folder, entry)
+                    elif any(os.path.splitext(file)[1] in extensions for file in future.result()):
+                        yield Title(directory, folder)
 
-                if os.path.isdir(path) and any(
-                    os.path.isfile(os.path.join(path, entry)) and os.path.splitext(entry)[1] in extensions
-                    for entry in os.listdir(path)
-                ):
-                    titles.append(Title(directory, folder))
+                completed += len(done)
+                if progress is not None:
+                    progress(completed, completed + len(pending))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        return titles
+        self._pruneIndex(folders, index)
 
-    def scanEpisodes(self, title: Title, extensions: list[str]) -> list[Episode]:
+    @traced("scanEpisodes")
+    def scanEpisodes(self, title: Title, extensions: list[str], index: LibraryIndex | None = None) -> list[Episode]:
         episodes: list[Episode] = []
         path = os.path.join(title.base, title.name)
+        if index is None:
+            index = LibraryIndex()
 
         if not os.path.isdir(path):
             print(f"Failed to find directory '{path}'!")
             return episodes
 
-        directories = os.listdir(path)
-        for directory in directories:
-            if os.path.isfile(os.path.join(path, directory)) and os.path.splitext(directory)[-1] in extensions:
-                episodes.append(Episode(directory, os.path.join(path, directory), path, 0.0, False))
+        for file in self._listFiles(path, index):
+            if os.path.splitext(file)[-1] in extensions:
+                episodes.append(Episode(file, os.path.join(path, file), path, 0.0, False))
 
         return episodes
+
+    def updateFolder(
+        self, folder: str, extensions: list[str], index: LibraryIndex
+    ) -> tuple[list[Title], list[Title], list[Title]]:
+        with index.lock:
+            cached = index.folders.get(folder)
+            previous = set(cached.directories) if cached is not None else set()
+
+        current = self._listDirectories(folder, index)
+        added: list[Title] = []
+        empty: list[Title] = []
+        for directory in current:
+            title = Title(directory, folder)
+            (added if self.hasEpisodes(title, extensions, index) else empty).append(title)
+
+        removed = [Title(directory, folder) for directory in previous.difference(current)]
+        with index.lock:
+            for title in removed:
+                index.directories.pop(os.path.join(title.base, title.name), None)
+                index.changed = True
+
+        return added, removed, empty
+
+    def hasEpisodes(self, title: Title, extensions: list[str], index: LibraryIndex) -> bool:
+        files = self._listFiles(os.path.join(title.base, title.name), index)
+        return any(os.path.splitext(file)[1] in extensions for file in files)
+
+    def _listDirectories(self, folder: str, index: LibraryIndex) -> list[str]:
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+            cached = index.folders.get(folder)
+            if cached is not None and cached.mtime == mtime:
+                return cached.directories
+
+            with os.scandir(folder) as entries:
+                directories = [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            print(f"Failed to find directory '{folder}'!")
+            return []
+
+        with index.lock:
+            index.folders[folder] = IndexedFolder(mtime, directories)
+            index.changed = True
+        return directories
+
+    def _listFiles(self, path: str, index: LibraryIndex) -> list[str]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            cached = index.directories.get(path)
+            if cached is not None and cached.mtime == mtime:
+                return cached.files
+
+            with os.scandir(path) as entries:
+                files = [entry.name for entry in entries if entry.is_file()]
+        except OSError:
+            with index.lock:
+                if index.directories.pop(path, None) is not None:
+                    index.changed = True
+            return []
+
+        with index.lock:
+            index.directories[path] = IndexedDirectory(mtime, files)
+            index.changed = True
+        return files
+
+    def _pruneIndex(self, folders: list[str], index: LibraryIndex) -> None:
+        with index.lock:
+            for folder in [f for f in index.folders if f not in folders]:
+                del index.folders[folder]
+                index.changed = True
+
+            known = {os.path.join(folder, d) for folder, cached in index.folders.items() for d in cached.directories}
+            for path in [p for p in index.directories if p not in known]:
+                del index.directories[path]
+                index.changed = True
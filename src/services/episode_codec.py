@@ -0,0 +1,83 @@
+import os
+
+import simplejson as json
+
+from models.episode import Episode
+
+FORMAT_VERSION = 2
+LOCAL_BASE = "."
+
+
+def encodeEpisodes(episodes: list[Episode], directory: str, header: dict | None = None) -> str:
+    bases: dict[str, int] = {}
+    records: list[str] = []
+    for e in episodes:
+        if e.path != os.path.join(e.base, e.name):
+            records.append(json.dumps(e.__dict__))
+            continue
+
+        key = LOCAL_BASE if e.base == directory else e.base
+        base = bases.setdefault(key, len(bases))
+        record = [base, e.name, e.progress, int(e.completed)]
+        if e.fingerprint is not None:
+            record.append(e.fingerprint)
+        records.append(json.dumps(record))
+
+    data = {"version": FORMAT_VERSION, **(header or {}), "bases": list(bases)}
+    return "\n".join([json.dumps(data), *records]) + "\n"
+
+
+def decodeEpisodes(text: str, directory: str) -> tuple[dict, list[Episode]]:
+    first, _, body = text.partition("\n")
+    header = _parseHeader(first)
+    if header is None:
+        return _decodeLegacy(text)
+
+    bases = _resolveBases(header, directory)
+    body = body.strip()
+    records = json.loads(f"[{body.replace(chr(10), ',')}]") if body else []
+    return header, [_decodeRecord(record, bases) for record in records]
+
+
+def encodeLegacyEpisodes(episodes: list[Episode]) -> str:
+    return json.dumps([e.__dict__ for e in episodes], indent=2)
+
+
+def encodeLegacyEpisodeConfig(index: int, episodes: list[Episode], header: dict | None = None) -> str:
+    data = {"index": index, **(header or {}), "episodes": [e.__dict__ for e in episodes]}
+    return json.dumps(data, indent=2)
+
+
+def _parseHeader(line: str) -> dict | None:
+    try:
+        header = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(header, dict) or "version" not in header:
+        return None
+    if header["version"] > FORMAT_VERSION:
+        raise ValueError(f"Unsupported episode format version {header['version']}")
+    return header
+
+
+def _decodeLegacy(text: str) -> tuple[dict, list[Episode]]:
+    data = json.loads(text)
+    if isinstance(data, list):
+        return {}, [Episode(**e) for e in data]
+    header = {key: value for key, value in data.items() if key != "episodes"}
+    return header, [Episode(**e) for e in data["episodes"]]
+
+
+def _resolveBases(header: dict, directory: str) -> list[tuple[str, str]]:
+    bases = [directory if base == LOCAL_BASE else base for base in header["bases"]]
+    return [(base, os.path.join(base, "")) for base in bases]
+
+
+def _decodeRecord(record: list | dict, bases: list[tuple[str, str]]) -> Episode:
+    if isinstance(record, dict):
+        return Episode(**record)
+
+    base, prefix = bases[record[0]]
+    name = record[1]
+    fingerprint = record[4] if len(record) > 4 else None
+    return Episode(name, prefix + name, base, record[2], bool(record[3]), fingerprint)
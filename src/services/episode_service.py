@@ -1,27 +1,159 @@
-import simplejson as json
+import hashlib
+import os
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import replace
 
 from models.episode import Episode
+from models.media_info import MediaInfo
+from services.metadata_service import MetadataService
+from services.progress_store import JsonProgressStore, ProgressStore
+from tracing import traced
+
+FINGERPRINT_CHUNK = 64 * 1024
 
 
 class EpisodeService:
+    def __init__(self) -> None:
+        self._store: ProgressStore = JsonProgressStore()
+        self._fingerprints: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self._metadata = MetadataService()
+
+    def setStore(self, store: ProgressStore) -> None:
+        self._store = store
+
+    def exists(self, path: str) -> bool:
+        return self._store.hasEpisodes(path)
+
+    @traced("status.load")
     def load(self, path: str) -> list[Episode]:
-        with open(path, "r", encoding="utf-8") as file:
-            data = json.loads(file.read())
-            return [Episode(**e) for e in data]
+        return self._store.loadEpisodes(path)
 
+    @traced("status.save")
     def save(self, path: str, episodes: list[Episode]) -> None:
-        with open(path, "w", encoding="utf-8") as file:
-            data = [e.__dict__ for e in episodes]
-            file.write(json.dumps(data, indent=2))
+        self._store.saveEpisodes(path, episodes)
+
+    @traced("status.loadLibrary")
+    def loadLibrary(self, paths: list[str]) -> dict[str, list[Episode]]:
+        return self._store.loadLibrary(paths)
+
+    @traced("status.saveLibrary")
+    def saveLibrary(self, library: dict[str, list[Episode]]) -> None:
+        self._store.saveLibrary(library)
+
+    def loadMetadata(self, path: str) -> None:
+        self._metadata.load(path)
+
+    def saveMetadata(self, path: str) -> None:
+        self._metadata.save(path)
+
+    def lookupMetadata(self, paths: list[str]) -> tuple[dict[str, MediaInfo | None], list[str]]:
+        return self._metadata.lookup(paths)
+
+    def probeMetadata(
+        self, paths: list[str], isCancelled: Callable[[], bool] | None = None
+    ) -> Iterator[tuple[str, MediaInfo | None]]:
+        return self._metadata.probe(paths, isCancelled)
+
+    def setThumbnailCache(self, directory: str, maxBytes: int) -> None:
+        self._metadata.setThumbnailCache(directory, maxBytes)
+
+    def thumbnails(
+        self, paths: list[str], isCancelled: Callable[[], bool] | None = None
+    ) -> Iterator[tuple[str, str | None]]:
+        return self._metadata.thumbnails(paths, isCancelled)
+
+    def close(self) -> None:
+        self._metadata.close()
 
     def matchEpisodes(self, base: list[Episode], status: list[Episode]) -> list[Episode]:
-        matched: list[Episode] = []
+        return self.matchLibrary({"": (base, status)})[""]
 
-        for b in base:
-            try:
-                index = [s.path for s in status].index(b.path)
-                matched.append(status[index])
-            except ValueError:
-                matched.append(b)
+    @traced("status.match")
+    def matchLibrary(self, library: dict[str, tuple[list[Episode], list[Episode]]]) -> dict[str, list[Episode]]:
+        matched: dict[str, list[Episode]] = {}
+        unmatched: list[tuple[list[Episode], int, Episode]] = []
+        orphans: dict[str, Episode] = {}
+
+        for key, (base, status) in library.items():
+            byPath = {s.path: s for s in status}
+            episodes: list[Episode] = []
+            for b in base:
+                s = byPath.pop(b.path, None)
+                if s is None:
+                    unmatched.append((episodes, len(episodes), b))
+                    episodes.append(b)
+                else:
+                    episodes.append(s)
+            matched[key] = episodes
+
+            for s in byPath.values():
+                if s.fingerprint is not None and self._hasProgress(s):
+                    orphans[s.fingerprint] = s
+
+        if orphans:
+            self._reattach(unmatched, orphans)
+
+        for episodes in matched.values():
+            for row, e in enumerate(episodes):
+                if e.fingerprint is None and self._hasProgress(e):
+                    episodes[row] = replace(e, fingerprint=self.fingerprint(e.path))
 
         return matched
+
+    def orphans(self, matched: list[Episode], status: list[Episode]) -> list[Episode]:
+        paths = {e.path for e in matched}
+        fingerprints = {e.fingerprint for e in matched}
+        return [
+            s
+            for s in status
+            if s.path not in paths
+            and s.fingerprint is not None
+            and s.fingerprint not in fingerprints
+            and self._hasProgress(s)
+        ]
+
+    def fingerprint(self, path: str) -> str | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._fingerprints.get(path)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(path, "rb") as file:
+                digest.update(file.read(FINGERPRINT_CHUNK))
+                if stat.st_size > FINGERPRINT_CHUNK * 2:
+                    file.seek(-FINGERPRINT_CHUNK, os.SEEK_END)
+                    digest.update(file.read(FINGERPRINT_CHUNK))
+        except OSError:
+            return None
+
+        fingerprint = f"{stat.st_size:x}-{digest.hexdigest()}"
+        with self._lock:
+            self._fingerprints[path] = (stat.st_size, stat.st_mtime_ns, fingerprint)
+        return fingerprint
+
+    def _reattach(self, unmatched: list[tuple[list[Episode], int, Episode]], orphans: dict[str, Episode]) -> None:
+        sizes = {fingerprint.split("-", 1)[0] for fingerprint in orphans}
+        for episodes, row, b in unmatched:
+            try:
+                if f"{os.path.getsize(b.path):x}" not in sizes:
+                    continue
+            except OSError:
+                continue
+
+            orphan = orphans.pop(self.fingerprint(b.path) or "", None)
+            if orphan is not None:
+                episodes[row] = Episode(b.name, b.path, b.base, orphan.progress, orphan.completed, orphan.fingerprint)
+                if not orphans:
+                    return
+
+    def _hasProgress(self, episode: Episode) -> bool:
+        return episode.completed or episode.progress > 0
@@ -0,0 +1,39 @@
+import os
+
+import simplejson as json
+
+from models.library_index import IndexedDirectory, IndexedFolder, LibraryIndex
+from utils import atomicWrite
+
+INDEX_VERSION = 1
+
+
+class IndexService:
+    def load(self, path: str) -> LibraryIndex:
+        if not os.path.isfile(path):
+            return LibraryIndex()
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.loads(file.read())
+        except (OSError, json.JSONDecodeError):
+            print(f"Failed to read library index '{path}', rebuilding.")
+            return LibraryIndex()
+
+        if data.get("version") != INDEX_VERSION:
+            return LibraryIndex()
+
+        folders = {key: IndexedFolder(**f) for key, f in data["folders"].items()}
+        directories = {key: IndexedDirectory(**d) for key, d in data["directories"].items()}
+        return LibraryIndex(folders, directories)
+
+    def save(self, path: str, index: LibraryIndex) -> None:
+        with index.lock:
+            data = {
+                "version": INDEX_VERSION,
+                "folders": {key: f.__dict__ for key, f in index.folders.items()},
+                "directories": {key: d.__dict__ for key, d in index.directories.items()},
+            }
+            index.changed = False
+
+        atomicWrite(path, json.dumps(data))
@@ -0,0 +1,119 @@
+import functools
+import os
+from typing import TYPE_CHECKING
+
+from models.media_info import MediaInfo
+from services.mpv_loader import loadMpv
+
+if TYPE_CHECKING:
+    import mpv
+
+PROBE_TIMEOUT = 10.0
+THUMBNAIL_TIMEOUT = 20.0
+THUMBNAIL_POSITION = "5%"
+THUMBNAIL_WIDTH = 320
+
+
+def probeMedia(path: str) -> MediaInfo | None:
+    player = _probePlayer()
+    try:
+        with player.prepare_and_wait_for_event("file-loaded", "end-file", cond=_isProbeDone, timeout=PROBE_TIMEOUT):
+            player.loadfile(path)
+
+        duration = player.duration
+        if duration is None:
+            return None
+
+        tracks = player.track_list or []
+        video = next((t for t in tracks if t.get("type") == "video" and not t.get("albumart")), None)
+        return MediaInfo(
+            float(duration),
+            [float(c["time"]) for c in player.chapter_list or []],
+            video.get("codec") if video is not None else None,
+            video.get("demux-w") if video is not None else None,
+            video.get("demux-h") if video is not None else None,
+            sum(1 for t in tracks if t.get("type") == "audio"),
+            sum(1 for t in tracks if t.get("type") == "sub"),
+        )
+    except TimeoutError:
+        raise TimeoutError(f"Timed out after {PROBE_TIMEOUT:g} s") from None
+    except loadMpv().ShutdownError:
+        _probePlayer.cache_clear()
+        raise RuntimeError("Probe player shut down") from None
+    finally:
+        if not player.core_shutdown:
+            player.command("stop")
+
+
+def renderThumbnail(path: str, target: str) -> bool:
+    player = _thumbnailPlayer()
+    temporary = f"{target}.{os.getpid()}.tmp.jpg"
+    try:
+        with player.prepare_and_wait_for_event(
+            "playback-restart", "end-file", cond=_isFrameReady, timeout=THUMBNAIL_TIMEOUT
+        ):
+            player.loadfile(path, start=THUMBNAIL_POSITION)
+
+        player.command("screenshot-to-file", temporary, "video")
+        os.replace(temporary, target)
+        return True
+    except TimeoutError:
+        print(f"Timed out rendering thumbnail for '{path}'!")
+        return False
+    except (SystemError, OSError):
+        if player.core_shutdown:
+            _thumbnailPlayer.cache_clear()
+        return False
+    finally:
+        if not player.core_shutdown:
+            player.command("stop")
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+@functools.cache
+def _probePlayer() -> "mpv.MPV":
+    return loadMpv().MPV(
+        vo="null",
+        ao="null",
+        vid="no",
+        aid="no",
+        sid="no",
+        pause=True,
+        idle=True,
+        ytdl=False,
+        config=False,
+        load_scripts=False,
+    )
+
+
+def _isProbeDone(event: "mpv.MpvEvent") -> bool:
+    mpv = loadMpv()
+    if event.event_id.value == mpv.MpvEventID.FILE_LOADED:
+        return True
+    return event.data.reason == mpv.MpvEventEndFile.ERROR
+
+
+@functools.cache
+def _thumbnailPlayer() -> "mpv.MPV":
+    return loadMpv().MPV(
+        vo="null",
+        ao="null",
+        aid="no",
+        sid="no",
+        pause=True,
+        idle=True,
+        hr_seek="yes",
+        vf=f"scale={THUMBNAIL_WIDTH}:-2",
+        screenshot_format="jpg",
+        ytdl=False,
+        config=False,
+        load_scripts=False,
+    )
+
+
+def _isFrameReady(event: "mpv.MpvEvent") -> bool:
+    mpv = loadMpv()
+    if event.event_id.value == mpv.MpvEventID.PLAYBACK_RESTART:
+        return True
+    return event.event_id.value == mpv.MpvEventID.END_FILE and event.data.reason == mpv.MpvEventEndFile.ERROR
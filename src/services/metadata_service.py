@@ -0,0 +1,195 @@
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, Future, ProcessPoolExecutor, wait
+
+import simplejson as json
+
+from models.media_info import CachedMediaInfo, MediaInfo
+from services.media_probe import probeMedia, renderThumbnail
+from services.thumbnail_cache import ThumbnailCache
+from utils import atomicWrite
+
+METADATA_VERSION = 1
+PROBE_WORKERS = 2
+PROBE_POLL_INTERVAL = 0.1
+
+
+class MetadataService:
+    def __init__(self) -> None:
+        self._cache: dict[str, CachedMediaInfo] = {}
+        self._changed = False
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._running: dict[tuple[str, str], list] = {}
+        self._thumbnails: ThumbnailCache | None = None
+
+    def load(self, path: str) -> None:
+        if not os.path.isfile(path):
+            return
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.loads(file.read())
+        except (OSError, json.JSONDecodeError):
+            print(f"Failed to read metadata cache '{path}', rebuilding.")
+            return
+
+        if data.get("version") != METADATA_VERSION:
+            return
+
+        cache: dict[str, CachedMediaInfo] = {}
+        for key, (size, mtime, info) in data["media"].items():
+            cache[key] = CachedMediaInfo(size, mtime, MediaInfo(**info) if info is not None else None)
+        with self._lock:
+            self._cache = cache
+            self._changed = False
+
+    def save(self, path: str) -> None:
+        with self._lock:
+            if not self._changed:
+                return
+
+            media = {
+                key: [c.size, c.mtime, c.info.__dict__ if c.info is not None else None]
+                for key, c in self._cache.items()
+            }
+            self._changed = False
+
+        atomicWrite(path, json.dumps({"version": METADATA_VERSION, "media": media}))
+
+    def setThumbnailCache(self, directory: str, maxBytes: int) -> None:
+        self._thumbnails = ThumbnailCache(directory, maxBytes)
+
+    def lookup(self, paths: list[str]) -> tuple[dict[str, MediaInfo | None], list[str]]:
+        found: dict[str, MediaInfo | None] = {}
+        missing: list[str] = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                found[path] = None
+                continue
+
+            with self._lock:
+                cached = self._cache.get(path)
+            if cached is not None and cached.size == stat.st_size and cached.mtime == stat.st_mtime_ns:
+                found[path] = cached.info
+            else:
+                missing.append(path)
+        return found, missing
+
+    def probe(
+        self, paths: list[str], isCancelled: Callable[[], bool] | None = None
+    ) -> Iterator[tuple[str, MediaInfo | None]]:
+        if not paths:
+            return
+
+        pending: dict[Future, tuple[str, os.stat_result]] = {}
+        try:
+            for path in paths:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                pending[self._submit(("probe", path), probeMedia, path)] = (path, stat)
+
+            while pending:
+                done, _ = wait(pending, timeout=PROBE_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                if isCancelled is not None and isCancelled():
+                    return
+                for future in done:
+                    path, stat = pending.pop(future)
+                    self._release(("probe", path), future)
+                    try:
+                        info = future.result()
+                    except Exception as e:
+                        print(f"Failed to probe '{path}': {e}")
+                        continue
+
+                    with self._lock:
+                        self._cache[path] = CachedMediaInfo(stat.st_size, stat.st_mtime_ns, info)
+                        self._changed = True
+                    yield path, info
+        finally:
+            for future, (path, _) in pending.items():
+                self._release(("probe", path), future)
+
+    def thumbnails(
+        self, paths: list[str], isCancelled: Callable[[], bool] | None = None
+    ) -> Iterator[tuple[str, str | None]]:
+        if self._thumbnails is None:
+            return
+
+        pending: dict[Future, tuple[str, str]] = {}
+        try:
+            for path in paths:
+                target = self._thumbnails.target(path)
+                if target is None:
+                    yield path, None
+                elif self._thumbnails.get(target):
+                    yield path, target
+                else:
+                    self._thumbnails.prepare(target)
+                    pending[self._submit(("thumbnail", target), renderThumbnail, path, target)] = (path, target)
+
+            while pending:
+                done, _ = wait(pending, timeout=PROBE_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                if isCancelled is not None and isCancelled():
+                    return
+
+                for future in done:
+                    path, target = pending.pop(future)
+                    self._release(("thumbnail", target), future)
+                    try:
+                        rendered = future.result()
+                    except Exception as e:
+                        print(f"Failed to render thumbnail for '{path}': {e}")
+                        rendered = False
+
+                    if rendered:
+                        self._thumbnails.add(target)
+                    yield path, target if rendered else None
+        finally:
+            for future, (_, target) in pending.items():
+                self._release(("thumbnail", target), future)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _submit(self, key: tuple[str, str], function: Callable, *args: object) -> Future:
+        with self._lock:
+            running = self._running.get(key)
+            if running is None or running[0].cancelled() or self._failed(running[0]):
+                running = self._running[key] = [self._startJob(function, *args), 0]
+            running[1] += 1
+            return running[0]
+
+    def _startJob(self, function: Callable, *args: object) -> Future:
+        if self._executor is not None:
+            try:
+                return self._executor.submit(function, *args)
+            except BrokenExecutor:
+                print("Media probe workers exited, restarting.")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+        self._executor = ProcessPoolExecutor(max_workers=PROBE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor.submit(function, *args)
+
+    def _failed(self, future: Future) -> bool:
+        return future.done() and future.exception() is not None
+
+    def _release(self, key: tuple[str, str], future: Future) -> None:
+        with self._lock:
+            running = self._running.get(key)
+            if running is None or running[0] is not future:
+                return
+
+            running[1] -= 1
+            if running[1] > 0:
+                return
+            del self._running[key]
+        future.cancel()
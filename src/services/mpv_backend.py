@@ -0,0 +1,70 @@
+from collections.abc import Callable
+
+from services.mpv_loader import loadMpv
+from services.player_backend import PlayerBackend
+
+PLAYLIST_HEADER = "#EXTM3U"
+
+
+class MpvBackend(PlayerBackend):
+    def __init__(self, wid: str) -> None:
+        self.player = loadMpv().MPV(
+            wid=wid,
+            ytdl=True,
+            input_cursor=True,
+            input_default_bindings=True,
+            input_vo_keyboard=True,
+            osc=True,
+        )
+
+    def onKeyPress(self, key: str, callback: Callable[[], None]) -> None:
+        self.player.on_key_press(key)(callback)
+
+    def observe(self, name: str, callback: Callable[[str, object], None]) -> None:
+        self.player.observe_property(name, callback)
+
+    def onEvent(self, name: str, callback: Callable[[], None]) -> None:
+        self.player.event_callback(name)(lambda _: callback())
+
+    def command(self, *args: str) -> None:
+        self.player.command(*args)
+
+    def keypress(self, key: str) -> None:
+        self.player.keypress(key)
+
+    def stop(self) -> None:
+        self.player.stop()
+
+    def clearPlaylist(self) -> None:
+        self.player.playlist_clear()
+
+    def appendFiles(self, paths: list[str]) -> None:
+        if paths:
+            self.player.loadlist("memory://" + "\n".join([PLAYLIST_HEADER, *paths]), "append")
+
+    def appendFile(self, path: str, start: float | None = None) -> None:
+        if start is None:
+            self.player.playlist_append(path)
+        else:
+            self.player.playlist_append(path, start=f"{start:.3f}")
+
+    def playlistPosition(self) -> int:
+        return self.player.playlist_pos
+
+    def setPlaylistPosition(self, position: int) -> None:
+        self.player.playlist_pos = position
+
+    def playlistCount(self) -> int:
+        return len(self.player.playlist)
+
+    def setPaused(self, paused: bool) -> None:
+        self.player.pause = paused
+
+    def seek(self, position: float) -> None:
+        self.player.time_pos = position
+
+    def next(self) -> None:
+        self.player.playlist_next()
+
+    def previous(self) -> None:
+        self.player.playlist_prev()
@@ -0,0 +1,12 @@
+import functools
+import importlib
+import os
+from types import ModuleType
+
+LIBMPV_PATH = "./_internal/libmpv-2.dll"
+
+
+@functools.cache
+def loadMpv() -> ModuleType:
+    os.environ["PATH"] = os.path.dirname(LIBMPV_PATH) + os.pathsep + os.environ["PATH"]
+    return importlib.import_module("mpv")
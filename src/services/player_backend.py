@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+
+class PlayerBackend(ABC):
+    @abstractmethod
+    def onKeyPress(self, key: str, callback: Callable[[], None]) -> None: ...
+
+    @abstractmethod
+    def observe(self, name: str, callback: Callable[[str, object], None]) -> None: ...
+
+    @abstractmethod
+    def onEvent(self, name: str, callback: Callable[[], None]) -> None: ...
+
+    @abstractmethod
+    def command(self, *args: str) -> None: ...
+
+    @abstractmethod
+    def stop(self) -> None: ...
+
+    @abstractmethod
+    def clearPlaylist(self) -> None: ...
+
+    @abstractmethod
+    def appendFiles(self, paths: list[str]) -> None: ...
+
+    @abstractmethod
+    def appendFile(self, path: str, start: float | None = None) -> None: ...
+
+    @abstractmethod
+    def playlistPosition(self) -> int: ...
+
+    @abstractmethod
+    def setPlaylistPosition(self, position: int) -> None: ...
+
+    @abstractmethod
+    def playlistCount(self) -> int: ...
+
+    @abstractmethod
+    def setPaused(self, paused: bool) -> None: ...
+
+    @abstractmethod
+    def seek(self, position: float) -> None: ...
+
+    def keypress(self, key: str) -> None:
+        self.command("keypress", key)
+
+    def next(self) -> None:
+        self.command("playlist-next")
+
+    def previous(self) -> None:
+        self.command("playlist-prev")
+
+    def moveEntry(self, index: int, target: int) -> None:
+        self.command("playlist-move", str(index), str(target))
+
+    def removeEntry(self, index: int) -> None:
+        self.command("playlist-remove", str(index))
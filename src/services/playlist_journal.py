@@ -0,0 +1,124 @@
+import os
+
+import simplejson as json
+
+from models.episode import Episode, EpisodeConfig
+from services.episode_codec import decodeEpisodes, encodeEpisodes, encodeLegacyEpisodeConfig
+from utils import atomicWrite
+
+JOURNAL_COMPACT_RECORDS = 2000
+
+
+class PlaylistJournal:
+    def __init__(self, path: str, compactFormat: bool = True, compactRecords: int = JOURNAL_COMPACT_RECORDS) -> None:
+        self._path = path
+        self._compactFormat = compactFormat
+        self._journalPath = f"{path}.journal"
+        self._compactRecords = compactRecords
+        self._generation = 0
+        self._records = 0
+        self._paths: list[str] | None = None
+        self._index = 0
+        self._states: list[tuple[float, bool, str | None]] = []
+
+    def load(self) -> EpisodeConfig:
+        with open(self._path, "r", encoding="utf-8") as file:
+            header, episodes = decodeEpisodes(file.read(), os.path.dirname(self._path))
+        index = header["index"]
+        self._generation = header.get("generation", 0)
+        self._records = 0
+
+        clean = True
+        if os.path.isfile(self._journalPath):
+            index, clean = self._replay(index, episodes)
+
+        config = EpisodeConfig(index, episodes)
+        if clean:
+            self._remember(config)
+        else:
+            self.compact(config)
+        return config
+
+    def save(self, config: EpisodeConfig) -> None:
+        if self._paths != [e.path for e in config.episodes]:
+            self.compact(config)
+            return
+
+        records: list[dict] = []
+        if config.index != self._index:
+            records.append({"index": config.index})
+        for row, (episode, state) in enumerate(zip(config.episodes, self._states, strict=True)):
+            if (episode.progress, episode.completed, episode.fingerprint) != state:
+                records.append(
+                    {
+                        "row": row,
+                        "progress": episode.progress,
+                        "completed": episode.completed,
+                        "fingerprint": episode.fingerprint,
+                    }
+                )
+        if not records:
+            return
+
+        if self._records + len(records) > self._compactRecords:
+            self.compact(config)
+            return
+
+        self._append(records)
+        self._remember(config)
+        self._records += len(records)
+
+    def compact(self, config: EpisodeConfig) -> None:
+        self._generation += 1
+        header = {"index": config.index, "generation": self._generation}
+        if self._compactFormat:
+            text = encodeEpisodes(config.episodes, os.path.dirname(self._path), header)
+        else:
+            text = encodeLegacyEpisodeConfig(config.index, config.episodes, {"generation": self._generation})
+        atomicWrite(self._path, text)
+        if os.path.isfile(self._journalPath):
+            os.remove(self._journalPath)
+        self._remember(config)
+        self._records = 0
+
+    def _replay(self, index: int, episodes: list[Episode]) -> tuple[int, bool]:
+        with open(self._journalPath, "r", encoding="utf-8") as file:
+            text = file.read()
+        lines = text.splitlines()
+
+        try:
+            header = json.loads(lines[0])
+            if header.get("generation") != self._generation:
+                return index, False
+        except (IndexError, AttributeError, json.JSONDecodeError):
+            return index, False
+
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+                if "index" in record:
+                    index = record["index"]
+                else:
+                    episode = episodes[record["row"]]
+                    episode.progress = record["progress"]
+                    episode.completed = record["completed"]
+                    episode.fingerprint = record["fingerprint"]
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                return index, False
+            self._records += 1
+        return index, text.endswith("\n")
+
+    def _append(self, records: list[dict]) -> None:
+        lines = [json.dumps(r) for r in records]
+        if not os.path.isfile(self._journalPath):
+            lines.insert(0, json.dumps({"generation": self._generation}))
+
+        with open(self._journalPath, "a", encoding="utf-8") as file:
+            file.write("".join(f"{line}\n" for line in lines))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _remember(self, config: EpisodeConfig) -> None:
+        self._paths = [e.path for e in config.episodes]
+        self._index = config.index
+        self._states = [(e.progress, e.completed, e.fingerprint) for e in config.episodes]
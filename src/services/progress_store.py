@@ -0,0 +1,96 @@
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from models.episode import Episode, EpisodeConfig
+from services.episode_codec import decodeEpisodes, encodeEpisodes, encodeLegacyEpisodes
+from services.playlist_journal import PlaylistJournal
+from utils import atomicWrite
+
+COPY_BATCH_SIZE = 100
+
+
+class ProgressStore(ABC):
+    @abstractmethod
+    def hasEpisodes(self, path: str) -> bool: ...
+
+    @abstractmethod
+    def loadEpisodes(self, path: str) -> list[Episode]: ...
+
+    @abstractmethod
+    def saveEpisodes(self, path: str, episodes: list[Episode]) -> None: ...
+
+    @abstractmethod
+    def hasEpisodeConfig(self, path: str) -> bool: ...
+
+    @abstractmethod
+    def loadEpisodeConfig(self, path: str) -> EpisodeConfig: ...
+
+    @abstractmethod
+    def saveEpisodeConfig(self, path: str, config: EpisodeConfig) -> None: ...
+
+    def loadLibrary(self, paths: list[str]) -> dict[str, list[Episode]]:
+        return {path: self.loadEpisodes(path) for path in paths if self.hasEpisodes(path)}
+
+    def saveLibrary(self, library: dict[str, list[Episode]]) -> None:
+        for path, episodes in library.items():
+            self.saveEpisodes(path, episodes)
+
+    def copyTo(
+        self,
+        target: "ProgressStore",
+        statusPaths: list[str],
+        playlistPaths: list[str],
+        isCancelled: Callable[[], bool] | None = None,
+    ) -> None:
+        statusPaths = [p for p in statusPaths if not target.hasEpisodes(p)]
+        for start in range(0, len(statusPaths), COPY_BATCH_SIZE):
+            if isCancelled is not None and isCancelled():
+                return
+            target.saveLibrary(self.loadLibrary(statusPaths[start : start + COPY_BATCH_SIZE]))
+        if isCancelled is not None and isCancelled():
+            return
+        for path in playlistPaths:
+            if self.hasEpisodeConfig(path) and not target.hasEpisodeConfig(path):
+                target.saveEpisodeConfig(path, self.loadEpisodeConfig(path))
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class JsonProgressStore(ProgressStore):
+    def __init__(self, compact: bool = True) -> None:
+        self._compact = compact
+        self._journals: dict[str, PlaylistJournal] = {}
+
+    def hasEpisodes(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def loadEpisodes(self, path: str) -> list[Episode]:
+        with open(path, "r", encoding="utf-8") as file:
+            return decodeEpisodes(file.read(), os.path.dirname(path))[1]
+
+    def saveEpisodes(self, path: str, episodes: list[Episode]) -> None:
+        if self._compact:
+            atomicWrite(path, encodeEpisodes(episodes, os.path.dirname(path)))
+        else:
+            atomicWrite(path, encodeLegacyEpisodes(episodes))
+
+    def hasEpisodeConfig(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def loadEpisodeConfig(self, path: str) -> EpisodeConfig:
+        return self._journal(path).load()
+
+    def saveEpisodeConfig(self, path: str, config: EpisodeConfig) -> None:
+        self._journal(path).save(config)
+
+    def _journal(self, path: str) -> PlaylistJournal:
+        journal = self._journals.get(path)
+        if journal is None:
+            journal = PlaylistJournal(path, self._compact)
+            self._journals[path] = journal
+        return journal
+
+    def close(self) -> None:
+        pass
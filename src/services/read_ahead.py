@@ -0,0 +1,69 @@
+import os
+import struct
+from collections.abc import Callable
+from typing import BinaryIO
+
+READ_CHUNK = 1024 * 1024
+INDEX_LIMIT = 64 * 1024 * 1024
+MP4_EXTENSIONS = (".mp4", ".m4v", ".mov")
+
+
+def warmFile(path: str, headBytes: int, tailBytes: int, isCancelled: Callable[[], bool]) -> int:
+    with open(path, "rb", buffering=0) as file:
+        size = os.fstat(file.fileno()).st_size
+        ranges = [(0, min(size, headBytes)), (max(0, size - tailBytes), size)]
+        if path.lower().endswith(MP4_EXTENSIONS):
+            index = _mp4Index(file, size)
+            if index is not None:
+                ranges.append(index)
+
+        if hasattr(os, "posix_fadvise"):
+            for start, end in ranges:
+                os.posix_fadvise(file.fileno(), start, end - start, os.POSIX_FADV_WILLNEED)
+
+        buffer = bytearray(READ_CHUNK)
+        read = 0
+        for start, end in _merge(ranges):
+            file.seek(start)
+            position = start
+            while position < end:
+                if isCancelled():
+                    return read
+                count = file.readinto(memoryview(buffer)[: min(READ_CHUNK, end - position)])
+                if not count:
+                    break
+                position += count
+                read += count
+        return read
+
+
+def _mp4Index(file: BinaryIO, size: int) -> tuple[int, int] | None:
+    offset = 0
+    while offset + 8 <= size:
+        file.seek(offset)
+        header = file.read(16)
+        if len(header) < 8:
+            return None
+
+        boxSize, boxType = struct.unpack(">I4s", header[:8])
+        if boxSize == 1 and len(header) == 16:
+            boxSize = struct.unpack(">Q", header[8:])[0]
+        elif boxSize == 0:
+            boxSize = size - offset
+        if boxSize < 8:
+            return None
+
+        if boxType == b"moov":
+            return offset, min(size, offset + min(boxSize, INDEX_LIMIT))
+        offset += boxSize
+    return None
+
+
+def _merge(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(r for r in ranges if r[1] > r[0]):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
@@ -0,0 +1,269 @@
+import re
+import unicodedata
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+GRAM_SIZE = 3
+FUZZY_THRESHOLD = 0.5
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+SUBSTRING_SCORE = 1.0
+FUZZY_SCORE = 0.5
+RAW_SCORE = 0.25
+NARROW_LIMIT = 256
+
+SEPARATOR_PATTERN = re.compile(r"[\W_]+")
+DIGIT_PATTERN = re.compile(r"\d")
+EPISODE_PATTERN = re.compile(r"\bs(?:eason)? ?0*(\d+) ?e(?:p(?:isode)?)? ?0*(\d+)\b")
+CROSS_PATTERN = re.compile(r"\b0*(\d+)x0*(\d+)\b")
+SEASON_PATTERN = re.compile(r"\bs(?:eason)? ?0*(\d+)\b")
+NUMBER_PATTERN = re.compile(r"\b0+(\d)")
+PARTIAL_PATTERN = re.compile(r"\b(?:s(?:eason)? ?0*(\d+) ?e(?:p(?:isode)?)? ?|0*(\d+)x(?=\d))0*(\d*)$")
+SEASON_TOKEN_PATTERN = re.compile(r"s(\d+)(?:e(\d*))?")
+
+
+@dataclass
+class Query:
+    text: str
+    terms: list[str]
+    partial: bool
+
+
+def normalise(text: str) -> list[str]:
+    return _tokenise(SEPARATOR_PATTERN.sub(" ", _fold(text)))
+
+
+def parseQuery(query: str) -> Query:
+    text = _fold(query)
+    words = SEPARATOR_PATTERN.sub(" ", text)
+    match = PARTIAL_PATTERN.search(words)
+    if match is None:
+        return Query(text.strip(), _tokenise(words), False)
+    return Query(text.strip(), [*_tokenise(words[: match.start()]), f"s{match[1] or match[2]}e{match[3]}"], True)
+
+
+def _fold(text: str) -> str:
+    text = text.casefold()
+    if not text.isascii():
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return text
+
+
+def _tokenise(text: str) -> list[str]:
+    if DIGIT_PATTERN.search(text):
+        text = EPISODE_PATTERN.sub(_episodeToken, text)
+        text = CROSS_PATTERN.sub(_episodeToken, text)
+        text = SEASON_PATTERN.sub(_seasonToken, text)
+        text = NUMBER_PATTERN.sub(_numberToken, text)
+    return text.split()
+
+
+def _episodeToken(match: re.Match[str]) -> str:
+    return f"s{match[1]}e{match[2]}"
+
+
+def _seasonToken(match: re.Match[str]) -> str:
+    return f"s{match[1]}"
+
+
+def _numberToken(match: re.Match[str]) -> str:
+    return match[1]
+
+
+class SearchIndex:
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[str, ...]] = {}
+        self._texts: dict[Hashable, str] = {}
+        self._tokens: dict[str, set[Hashable]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._last: tuple[Query, dict[Hashable, float]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._texts.clear()
+        self._tokens.clear()
+        self._grams.clear()
+        self._last = None
+
+    def setEntries(self, entries: Iterable[tuple[Hashable, str]]) -> None:
+        self.clear()
+        self.addEntries(entries)
+
+    def addEntries(self, entries: Iterable[tuple[Hashable, str]]) -> None:
+        for key, text in entries:
+            if key in self._entries:
+                self._removeEntry(key)
+
+            folded = _fold(text)
+            tokens = tuple(_tokenise(SEPARATOR_PATTERN.sub(" ", folded)))
+            self._entries[key] = tokens
+            self._texts[key] = folded
+            for token in tokens:
+                keys = self._tokens.get(token)
+                if keys is None:
+                    keys = self._tokens[token] = set()
+                    for gram in self._tokenGrams(token):
+                        self._grams.setdefault(gram, set()).add(token)
+                keys.add(key)
+        self._last = None
+
+    def removeEntries(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            if key in self._entries:
+                self._removeEntry(key)
+        self._last = None
+
+    def search(self, query: str) -> dict[Hashable, float] | None:
+        parsed = parseQuery(query)
+        if not parsed.terms:
+            return None
+
+        scores = None
+        if self._last is not None and len(self._last[1]) <= NARROW_LIMIT and self._narrows(self._last[0], parsed):
+            scores = self._searchWithin(parsed, self._last[1])
+        if not scores:
+            scores = self._searchAll(parsed)
+
+        self._last = (parsed, scores) if scores else None
+        return scores
+
+    def _removeEntry(self, key: Hashable) -> None:
+        del self._texts[key]
+        for token in self._entries.pop(key):
+            keys = self._tokens.get(token)
+            if keys is None:
+                continue
+
+            keys.discard(key)
+            if not keys:
+                del self._tokens[token]
+                for gram in self._tokenGrams(token):
+                    tokens = self._grams[gram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._grams[gram]
+
+    def _narrows(self, previous: Query, query: Query) -> bool:
+        if not query.text.startswith(previous.text) or len(query.terms) < len(previous.terms):
+            return False
+        last = len(previous.terms) - 1
+        if query.terms[:last] != previous.terms[:last]:
+            return False
+        if SEASON_TOKEN_PATTERN.fullmatch(previous.terms[last]) is not None:
+            return self._score(previous.terms[last], query.terms[last], previous.partial) > 0
+        return query.terms[last].startswith(previous.terms[last])
+
+    def _searchWithin(self, query: Query, candidates: dict[Hashable, float]) -> dict[Hashable, float]:
+        last = len(query.terms) - 1
+        scores: dict[Hashable, float] = {}
+        for key in candidates:
+            tokens = self._entries.get(key)
+            if tokens is None:
+                continue
+
+            total = 0.0
+            for i, term in enumerate(query.terms):
+                partial = query.partial and i == last
+                score = max((self._score(term, token, partial) for token in tokens), default=0.0)
+                if score <= 0:
+                    break
+                total += score
+            else:
+                scores[key] = total
+        return scores or self._matchText(query.text, candidates)
+
+    def _searchAll(self, query: Query) -> dict[Hashable, float]:
+        last = len(query.terms) - 1
+        matches = sorted(
+            (self._matchTerm(term, query.partial and i == last) for i, term in enumerate(query.terms)), key=len
+        )
+        scores = matches[0]
+        for other in matches[1:]:
+            scores = {key: score + other[key] for key, score in scores.items() if key in other}
+            if not scores:
+                break
+        return scores or self._matchText(query.text, self._texts)
+
+    def _matchText(self, text: str, candidates: Iterable[Hashable]) -> dict[Hashable, float]:
+        return {key: RAW_SCORE for key in candidates if text in self._texts.get(key, "")}
+
+    def _matchTerm(self, term: str, partial: bool = False) -> dict[Hashable, float]:
+        tokens = self._substringTokens(term)
+        if not tokens and SEASON_TOKEN_PATTERN.fullmatch(term) is None:
+            return self._fuzzyTerm(term)
+
+        scores: dict[Hashable, float] = {}
+        for token in tokens:
+            score = self._score(term, token, partial)
+            if score <= 0:
+                continue
+            for key in self._tokens[token]:
+                if scores.get(key, 0.0) < score:
+                    scores[key] = score
+        return scores
+
+    def _substringTokens(self, term: str) -> list[str]:
+        grams = self._termGrams(term)
+        postings = sorted((self._grams.get(gram, set()) for gram in grams), key=len)
+        if not postings or not postings[0]:
+            return []
+
+        candidates = postings[0].intersection(*postings[1:])
+        return [token for token in candidates if term in token]
+
+    def _fuzzyTerm(self, term: str) -> dict[Hashable, float]:
+        grams = self._termGrams(term)
+        if len(term) < GRAM_SIZE:
+            return {}
+
+        counts: dict[str, int] = {}
+        for gram in grams:
+            for token in self._grams.get(gram, ()):
+                counts[token] = counts.get(token, 0) + 1
+
+        scores: dict[Hashable, float] = {}
+        for token, count in counts.items():
+            ratio = count / max(len(grams), len(token) - GRAM_SIZE + 1)
+            if ratio < FUZZY_THRESHOLD:
+                continue
+
+            score = FUZZY_SCORE * ratio
+            for key in self._tokens[token]:
+                if scores.get(key, 0.0) < score:
+                    scores[key] = score
+        return scores
+
+    def _score(self, term: str, token: str, partial: bool = False) -> float:
+        season = SEASON_TOKEN_PATTERN.fullmatch(term)
+        if season is not None:
+            return self._seasonScore(season, token, partial)
+        if token == term:
+            return EXACT_SCORE
+        if token.startswith(term):
+            return PREFIX_SCORE
+        if term in token:
+            return SUBSTRING_SCORE
+        return 0.0
+
+    def _seasonScore(self, term: re.Match[str], token: str, partial: bool) -> float:
+        match = SEASON_TOKEN_PATTERN.fullmatch(token)
+        if match is None or match[1] != term[1] or match[2] == "":
+            return 0.0
+        if term[2] is None:
+            return EXACT_SCORE if match[2] is None else PREFIX_SCORE
+        if match[2] is None:
+            return 0.0
+        if match[2] == term[2]:
+            return EXACT_SCORE
+        return PREFIX_SCORE if (partial or not term[2]) and match[2].startswith(term[2]) else 0.0
+
+    def _termGrams(self, term: str) -> set[str]:
+        if len(term) <= GRAM_SIZE:
+            return {term}
+        return {term[i : i + GRAM_SIZE] for i in range(len(term) - GRAM_SIZE + 1)}
+
+    def _tokenGrams(self, token: str) -> set[str]:
+        return {token[i : i + size] for size in range(1, GRAM_SIZE + 1) for i in range(len(token) - size + 1)}
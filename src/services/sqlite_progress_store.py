@@ -0,0 +1,162 @@
+import os
+import sqlite3
+import threading
+
+from models.episode import Episode, EpisodeConfig
+from services.progress_store import ProgressStore
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    title TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    base TEXT NOT NULL,
+    progress REAL NOT NULL,
+    completed INTEGER NOT NULL,
+    fingerprint TEXT,
+    PRIMARY KEY (title, position)
+);
+CREATE INDEX IF NOT EXISTS episodes_path ON episodes (path);
+CREATE TABLE IF NOT EXISTS titles (
+    title TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS playlists (
+    playlist TEXT PRIMARY KEY,
+    idx INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS playlist_episodes (
+    playlist TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    base TEXT NOT NULL,
+    progress REAL NOT NULL,
+    completed INTEGER NOT NULL,
+    fingerprint TEXT,
+    PRIMARY KEY (playlist, position)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+EPISODE_COLUMNS = "path, name, base, progress, completed, fingerprint"
+EPISODE_VALUES = "?, ?, ?, ?, ?, ?, ?, ?"
+
+
+class SqliteProgressStore(ProgressStore):
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            self._connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('version', ?)", (str(SCHEMA_VERSION),)
+            )
+
+    def hasEpisodes(self, path: str) -> bool:
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM titles WHERE title = ?", (self._title(path),)).fetchone()
+        return row is not None
+
+    def loadEpisodes(self, path: str) -> list[Episode]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {EPISODE_COLUMNS} FROM episodes WHERE title = ? ORDER BY position", (self._title(path),)
+            ).fetchall()
+        return [self._episode(row) for row in rows]
+
+    def saveEpisodes(self, path: str, episodes: list[Episode]) -> None:
+        self.saveLibrary({path: episodes})
+
+    def loadLibrary(self, paths: list[str]) -> dict[str, list[Episode]]:
+        titles = {self._title(path): path for path in paths}
+        library: dict[str, list[Episode]] = {}
+        with self._lock:
+            known = {row[0] for row in self._connection.execute("SELECT title FROM titles")}
+            for title, path in titles.items():
+                if title in known:
+                    library[path] = []
+            rows = self._connection.execute(f"SELECT title, {EPISODE_COLUMNS} FROM episodes ORDER BY title, position")
+            for row in rows:
+                path = titles.get(row[0])
+                if path is not None:
+                    library[path].append(self._episode(row[1:]))
+        return library
+
+    def saveLibrary(self, library: dict[str, list[Episode]]) -> None:
+        with self._lock, self._connection:
+            for path, episodes in library.items():
+                title = self._title(path)
+                self._connection.execute("INSERT OR IGNORE INTO titles (title) VALUES (?)", (title,))
+                self._connection.execute("DELETE FROM episodes WHERE title = ?", (title,))
+                self._connection.executemany(
+                    f"INSERT INTO episodes (title, position, {EPISODE_COLUMNS}) VALUES ({EPISODE_VALUES})",
+                    [(title, i, *self._row(e)) for i, e in enumerate(episodes)],
+                )
+
+    def hasEpisodeConfig(self, path: str) -> bool:
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM playlists WHERE playlist = ?", (path,)).fetchone()
+        return row is not None
+
+    def loadEpisodeConfig(self, path: str) -> EpisodeConfig:
+        with self._lock:
+            row = self._connection.execute("SELECT idx FROM playlists WHERE playlist = ?", (path,)).fetchone()
+            if row is None:
+                raise FileNotFoundError(path)
+            rows = self._connection.execute(
+                f"SELECT {EPISODE_COLUMNS} FROM playlist_episodes WHERE playlist = ? ORDER BY position", (path,)
+            ).fetchall()
+        return EpisodeConfig(row[0], [self._episode(r) for r in rows])
+
+    def saveEpisodeConfig(self, path: str, config: EpisodeConfig) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO playlists (playlist, idx) VALUES (?, ?)", (path, config.index)
+            )
+            self._connection.execute("DELETE FROM playlist_episodes WHERE playlist = ?", (path,))
+            self._connection.executemany(
+                f"INSERT INTO playlist_episodes (playlist, position, {EPISODE_COLUMNS}) VALUES ({EPISODE_VALUES})",
+                [(path, i, *self._row(e)) for i, e in enumerate(config.episodes)],
+            )
+
+    def titles(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self._connection.execute("SELECT title FROM titles ORDER BY title")]
+
+    def needsImport(self) -> bool:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = 'imported'").fetchone()
+        return row is None
+
+    def markImported(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('imported', '1')")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _title(self, path: str) -> str:
+        return os.path.dirname(path)
+
+    def _row(self, episode: Episode) -> tuple:
+        return (
+            episode.path,
+            episode.name,
+            episode.base,
+            episode.progress,
+            int(episode.completed),
+            episode.fingerprint,
+        )
+
+    def _episode(self, row: tuple) -> Episode:
+        path, name, base, progress, completed, fingerprint = row
+        return Episode(name, path, base, progress, bool(completed), fingerprint)
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import threading
+
+THUMBNAIL_EXTENSION = ".jpg"
+EVICT_RATIO = 0.9
+TEMPORARY_MARKER = ".tmp"
+
+
+class ThumbnailCache:
+    def __init__(self, directory: str, maxBytes: int) -> None:
+        self._directory = directory
+        self._maxBytes = maxBytes
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def target(self, path: str) -> str | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = hashlib.blake2b(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}".encode(), digest_size=16).hexdigest()
+        return os.path.join(self._directory, key[:2], key + THUMBNAIL_EXTENSION)
+
+    def get(self, target: str) -> bool:
+        try:
+            os.utime(target)
+        except OSError:
+            return False
+        return True
+
+    def add(self, target: str) -> None:
+        try:
+            size = os.path.getsize(target)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._measure()
+            else:
+                self._size += size
+            if self._size > self._maxBytes:
+                self._evict()
+
+    def prepare(self, target: str) -> None:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    def _measure(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _evict(self) -> None:
+        for path, _, size in sorted(self._entries(), key=lambda entry: entry[1]):
+            if self._size <= self._maxBytes * EVICT_RATIO:
+                return
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+
+    def _entries(self) -> list[tuple[str, int, int]]:
+        entries: list[tuple[str, int, int]] = []
+        for directory, _, files in os.walk(self._directory):
+            for file in files:
+                if not file.endswith(THUMBNAIL_EXTENSION) or TEMPORARY_MARKER in file:
+                    continue
+
+                path = os.path.join(directory, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime_ns, stat.st_size))
+        return entries
@@ -0,0 +1,156 @@
+import contextlib
+import functools
+import math
+import os
+import statistics
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TypeVar
+
+import simplejson as json
+
+from utils import atomicWrite
+
+TRACE_ENV = "QUICKPLAY_TRACE"
+TRACE_FILE = "_internal/trace.json"
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass
+class _TraceState:
+    enabled: bool = False
+    path: str = TRACE_FILE
+
+
+_state = _TraceState()
+_origin = time.perf_counter()
+_events: list[dict] = []
+_durations: dict[str, list[float]] = {}
+_counters: dict[str, float] = {}
+_lock = threading.Lock()
+_nullSpan = contextlib.nullcontext()
+
+
+def enable(path: str | None = None) -> None:
+    _state.enabled = True
+    _state.path = path or TRACE_FILE
+
+
+def enableFromEnvironment() -> None:
+    path = os.environ.get(TRACE_ENV)
+    if path:
+        enable(None if path == "1" else path)
+
+
+def isEnabled() -> bool:
+    return _state.enabled
+
+
+def span(name: str, **args: object) -> contextlib.AbstractContextManager:
+    if not _state.enabled:
+        return _nullSpan
+    return _span(name, args)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            if not _state.enabled:
+                return function(*args, **kwargs)
+            with _span(name, {}):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def begin(name: str) -> tuple[str, float, int] | None:
+    if not _state.enabled:
+        return None
+    return name, time.perf_counter(), threading.get_ident()
+
+
+def end(token: tuple[str, float, int] | None, **args: object) -> None:
+    if token is not None:
+        name, start, thread = token
+        _record(name, start, time.perf_counter(), thread, args)
+
+
+def count(name: str, value: float = 1) -> None:
+    if not _state.enabled:
+        return
+    with _lock:
+        total = _counters[name] = _counters.get(name, 0) + value
+    _addCounterEvent(name, {name: total})
+
+
+def setCounters(prefix: str, counters: dict[str, float]) -> None:
+    if not _state.enabled:
+        return
+    with _lock:
+        for key, value in counters.items():
+            _counters[f"{prefix}.{key}"] = value
+    _addCounterEvent(prefix, dict(counters))
+
+
+def summary() -> str:
+    with _lock:
+        durations = {name: sorted(values) for name, values in _durations.items()}
+        counters = dict(_counters)
+
+    width = max((len(name) for name in [*durations, *counters]), default=4)
+    lines = [f"{'span':<{width}} {'count':>7} {'total ms':>10} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        p95 = values[math.ceil(len(values) * 0.95) - 1]
+        lines.append(
+            f"{name:<{width}} {len(values):>7} {sum(values):>10.2f} {statistics.fmean(values):>9.2f} "
+            f"{p95:>9.2f} {values[-1]:>9.2f}"
+        )
+    if counters:
+        lines.append(f"{'counter':<{width}} {'value':>7}")
+        lines.extend(f"{name:<{width}} {value:>7g}" for name, value in sorted(counters.items()))
+    return "\n".join(lines)
+
+
+def report() -> None:
+    if not _state.enabled:
+        return
+
+    try:
+        atomicWrite(_state.path, json.dumps({"traceEvents": list(_events), "displayTimeUnit": "ms"}))
+    except OSError as e:
+        print(f"Failed to write trace '{_state.path}': {e}")
+    print(summary())
+
+
+@contextlib.contextmanager
+def _span(name: str, args: dict) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, start, time.perf_counter(), threading.get_ident(), args)
+
+
+def _record(name: str, start: float, end: float, thread: int, args: dict) -> None:
+    startMicros = _micros(start)
+    event = {"name": name, "ph": "X", "ts": startMicros, "dur": _micros(end) - startMicros}
+    event["pid"], event["tid"] = os.getpid(), thread
+    if args:
+        event["args"] = args
+    _events.append(event)
+    with _lock:
+        _durations.setdefault(name, []).append((end - start) * 1000)
+
+
+def _addCounterEvent(name: str, values: dict[str, float]) -> None:
+    _events.append({"name": name, "ph": "C", "ts": _micros(time.perf_counter()), "pid": os.getpid(), "args": values})
+
+
+def _micros(timestamp: float) -> float:
+    return round((timestamp - _origin) * 1_000_000, 1)
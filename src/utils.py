@@ -1,23 +1,114 @@
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon, QPainter, QPalette, QPixmap
+import functools
+import os
+import stat
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QColor, QGuiApplication, QIcon, QImage, QImageReader, QPainter, QPalette, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 
+T = TypeVar("T")
+
+_pixmapCache: dict[tuple[str, QPalette.ColorRole, int, float], tuple[int, QPixmap, QIcon]] = {}
+_svgCache: dict[str, QSvgRenderer] = {}
+
 
 def getStylesheet(path: str) -> str:
     with open(path, "r", encoding="utf-8") as styles:
         return styles.read()
 
 
-def makeIcon(name: str, color: QPalette.ColorRole, size: int = 24) -> QIcon:
-    palette = QPalette()
-    pixmap = QPixmap(size, size)
+def atomicWrite(path: str, text: str) -> None:
+    directory, name = os.path.split(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        os.chmod(temporary, _fileMode(path))
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _fileMode(path: str) -> int:
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_umask()
+
+
+@functools.cache
+def _umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def makeIcon(name: str, color: QPalette.ColorRole, size: int = 24, ratio: float | None = None) -> QIcon:
+    return _renderIcon(name, color, size, ratio)[1]
+
+
+def makePixmap(name: str, color: QPalette.ColorRole, size: int = 24, ratio: float | None = None) -> QPixmap:
+    return _renderIcon(name, color, size, ratio)[0]
+
+
+def _renderIcon(name: str, color: QPalette.ColorRole, size: int, ratio: float | None) -> tuple[QPixmap, QIcon]:
+    if ratio is None:
+        application = QGuiApplication.instance()
+        ratio = application.devicePixelRatio() if isinstance(application, QGuiApplication) else 1.0
+
+    rgba = QPalette().color(color).rgba()
+    key = (name, color, size, ratio)
+    cached = _pixmapCache.get(key)
+    if cached is not None and cached[0] == rgba:
+        return cached[1], cached[2]
+
+    pixmap = QPixmap(round(size * ratio), round(size * ratio))
     pixmap.fill(Qt.GlobalColor.transparent)
 
     painter = QPainter(pixmap)
-    renderer = QSvgRenderer(f"_internal/icons/{name}.svg")
+    renderer = _svgCache.get(name)
+    if renderer is None:
+        renderer = _svgCache[name] = QSvgRenderer(f"_internal/icons/{name}.svg")
     renderer.render(painter)
     painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-    painter.fillRect(pixmap.rect(), palette.color(color))
+    painter.fillRect(pixmap.rect(), QColor.fromRgba(rgba))
     painter.end()
 
-    return QIcon(pixmap)
+    pixmap.setDevicePixelRatio(ratio)
+    icon = QIcon(pixmap)
+    _pixmapCache[key] = (rgba, pixmap, icon)
+    return pixmap, icon
+
+
+def loadImage(path: str, size: QSize) -> QImage | None:
+    reader = QImageReader(path)
+    reader.setScaledSize(reader.size().scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    return None if image.isNull() else image
+
+
+def formatDuration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes}:{seconds:02}"
+
+
+def iterBatches(items: Iterable[T], size: int, interval: float) -> Iterator[list[T]]:
+    batch: list[T] = []
+    deadline = time.monotonic() + interval
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size or time.monotonic() >= deadline:
+            yield batch
+            batch = []
+            deadline = time.monotonic() + interval
+
+    if batch:
+        yield batch
@@ -1,10 +1,14 @@
-from PyQt6.QtCore import QModelIndex, QSize, QSortFilterProxyModel, Qt, pyqtSignal
-from PyQt6.QtGui import QIcon, QPainter, QPalette, QStandardItem, QStandardItemModel
+from collections.abc import Callable
+
+from PyQt6.QtCore import QEvent, QModelIndex, QPointF, QRect, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QFont, QFontMetrics, QImage, QPainter, QPalette, QPixmap, QStaticText, QTransform
 from PyQt6.QtWidgets import (
     QApplication,
     QHBoxLayout,
+    QLabel,
     QLineEdit,
     QListView,
+    QProgressBar,
     QPushButton,
     QScrollBar,
     QStyle,
@@ -15,47 +19,118 @@ from PyQt6.QtWidgets import (
 )
 
 from models.episode import Episode
-from utils import makeIcon
+from models.media_info import MediaInfo
+from tracing import traced
+from utils import formatDuration, makePixmap
+from views.list_model import VALUE_ROLE, ListModel
+from views.row_requests import RowRequests
+from views.row_thumbnails import THUMBNAIL_SIZE, RowThumbnails
+from views.search_proxy_model import SearchProxyModel
+
+STATUS_ICON_SIZE = 12
+TEXT_CACHE_SIZE = 4096
+STATUS_ICONS = (
+    ("circle", QPalette.ColorRole.PlaceholderText),
+    ("clock", QPalette.ColorRole.Text),
+    ("check-circle", QPalette.ColorRole.BrightText),
+)
+ACCENT_ROLE = QPalette.ColorRole.Accent
+TEXT_ROLE = QPalette.ColorRole.Text
+DETAIL_ROLE = QPalette.ColorRole.PlaceholderText
+STATUS_ICON_EVENTS = (
+    QEvent.Type.PaletteChange,
+    QEvent.Type.StyleChange,
+    QEvent.Type.FontChange,
+    QEvent.Type.DevicePixelRatioChange,
+)
 
 
 class EpisodeItemDelegate(QStyledItemDelegate):
-    def __init__(self, parent: QListView) -> None:
+    def __init__(
+        self,
+        parent: QListView,
+        statusIcon: Callable[[Episode], QPixmap],
+        thumbnail: Callable[[Episode], QPixmap],
+        detailText: Callable[[Episode], str],
+    ) -> None:
         super().__init__(parent)
-        self.iconSize = 12
+        self.iconSize = STATUS_ICON_SIZE
         self.iconSpacing = 4
+        self._statusIcon = statusIcon
+        self._thumbnail = thumbnail
+        self._detailText = detailText
+        self._style: QStyle | None = None
+        self._layouts: dict[int, tuple[QRect, int, int, int, int]] = {}
+        self._texts: dict[tuple[str, int], tuple[QStaticText, float]] = {}
+        self._font: QFont | None = None
 
-    def paint(self, painter: QPainter | None, option: QStyleOptionViewItem, index: QModelIndex) -> None:
-        painter.save()
+    def invalidateLayout(self) -> None:
+        self._style = None
+        self._font = None
+        self._layouts.clear()
+        self._texts.clear()
 
-        style = QApplication.style()
-        option.decorationSize = QSize(0, 0)
-        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, None)
+    def paint(self, painter: QPainter | None, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        rect = option.rect
+        left, top, height = rect.left(), rect.top(), rect.height()
+        indicatorRect, iconOffset, thumbnailLeft, thumbnailOffset, textOffset = self._layout(height)
+        self._style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, None)
 
         if option.state & QStyle.StateFlag.State_Selected:
-            accentColor = option.palette.color(QPalette.ColorRole.Accent)
-            focusHMargin = style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin)
-            indicatorWidth = style.pixelMetric(QStyle.PixelMetric.PM_DefaultFrameWidth)
-            indicatorHeight = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorHeight)
-            vOffset = (option.rect.height() - indicatorHeight) // 2
-            indicatorRect = option.rect.adjusted(
-                focusHMargin, vOffset, -option.rect.width() + focusHMargin + indicatorWidth, -vOffset
-            )
-            painter.fillRect(indicatorRect, accentColor)
-
-        text_offset = self.iconSize + self.iconSpacing * 2
-        option.rect = option.rect.adjusted(text_offset, 0, 0, 0)
-
-        text = index.data(Qt.ItemDataRole.DisplayRole)
-        painter.setPen(option.palette.text().color())
-        painter.drawText(option.rect, Qt.AlignmentFlag.AlignVCenter, text)
-
-        painter.restore()
-
-        icon: QIcon = index.data(Qt.ItemDataRole.DecorationRole)
-        if icon:
-            icon_x = option.rect.left() - text_offset + self.iconSpacing
-            icon_y = option.rect.top() + (option.rect.height() - self.iconSize) // 2
-            painter.drawPixmap(icon_x, icon_y, self.iconSize, self.iconSize, icon.pixmap(self.iconSize, self.iconSize))
+            painter.fillRect(indicatorRect.translated(left, top), option.palette.color(ACCENT_ROLE))
+
+        episode: Episode = index.data(VALUE_ROLE)
+        painter.drawPixmap(left + self.iconSpacing, top + iconOffset, self._statusIcon(episode))
+        painter.drawPixmap(left + thumbnailLeft, top + thumbnailOffset, self._thumbnail(episode))
+
+        textLeft = rect.right()
+        detail = self._detailText(episode)
+        if detail:
+            text, textHeight = self._texts.get((detail, 0)) or self._prepareText(detail, 0, painter)
+            textLeft -= text.size().width() + self.iconSpacing * 2
+            painter.setPen(option.palette.color(DETAIL_ROLE))
+            painter.drawStaticText(QPointF(textLeft, top + (height - textHeight) / 2), text)
+
+        width = max(1, int(textLeft) - left - textOffset - self.iconSpacing * 2)
+        text, textHeight = self._texts.get((episode.name, width)) or self._prepareText(episode.name, width, painter)
+        painter.setPen(option.palette.color(TEXT_ROLE))
+        painter.drawStaticText(QPointF(left + textOffset, top + (height - textHeight) / 2), text)
+
+    def _prepareText(self, text: str, width: int, painter: QPainter) -> tuple[QStaticText, float]:
+        if self._font is None:
+            self._font = painter.font()
+        if len(self._texts) >= TEXT_CACHE_SIZE:
+            self._texts.clear()
+
+        elided = QFontMetrics(self._font).elidedText(text, Qt.TextElideMode.ElideRight, width) if width else text
+        staticText = QStaticText(elided)
+        staticText.setTextFormat(Qt.TextFormat.PlainText)
+        staticText.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        staticText.prepare(QTransform(), self._font)
+        prepared = self._texts[(text, width)] = (staticText, staticText.size().height())
+        return prepared
+
+    def _layout(self, height: int) -> tuple[QRect, int, int, int, int]:
+        layout = self._layouts.get(height)
+        if layout is not None and self._style is not None:
+            return layout
+
+        if self._style is None:
+            self._style = QApplication.style()
+            self._layouts.clear()
+
+        focusHMargin = self._style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin)
+        indicatorWidth = self._style.pixelMetric(QStyle.PixelMetric.PM_DefaultFrameWidth)
+        indicatorHeight = self._style.pixelMetric(QStyle.PixelMetric.PM_IndicatorHeight)
+        vOffset = (height - indicatorHeight) // 2
+        indicatorRect = QRect(focusHMargin, vOffset, indicatorWidth, height - vOffset * 2)
+        iconOffset = (height - self.iconSize) // 2
+        thumbnailLeft = self.iconSize + self.iconSpacing * 2
+        thumbnailOffset = (height - THUMBNAIL_SIZE.height()) // 2
+        textOffset = thumbnailLeft + THUMBNAIL_SIZE.width() + self.iconSpacing * 2
+
+        layout = self._layouts[height] = (indicatorRect, iconOffset, thumbnailLeft, thumbnailOffset, textOffset)
+        return layout
 
     def sizeHint(self, option: QStyleOptionViewItem, index: int) -> QSize:
         return super().sizeHint(option, index)
@@ -64,16 +139,23 @@ class EpisodeItemDelegate(QStyledItemDelegate):
 class EpisodeSelect(QWidget):
     episodesSelected = pyqtSignal(list)
     backClicked = pyqtSignal()
+    thumbnailsRequested = pyqtSignal(list, QSize)
+    mediaInfoRequested = pyqtSignal(list)
+    durationsRequested = pyqtSignal(list)
 
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
-        self._episodes: list[Episode] = []
+        self._icons = self._statusIcons()
+        self._mediaInfo: dict[str, MediaInfo | None] = {}
+        self._staleMediaInfo: set[str] = set()
 
         self._layout = QVBoxLayout()
         self.setLayout(self._layout)
 
         self._createSearch()
         self._createEpisodeList()
+        self._createSummary()
+        self._createProgress()
         self._createButtons()
         self._connectSignals()
 
@@ -83,20 +165,33 @@ class EpisodeSelect(QWidget):
         self._layout.addWidget(self._search)
 
     def _createEpisodeList(self) -> None:
-        self._sourceModel = QStandardItemModel()
-        self._proxyModel = QSortFilterProxyModel()
-        self._proxyModel.setSourceModel(self._sourceModel)
-        self._proxyModel.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._sourceModel = ListModel(lambda e: e.path, lambda e: e.name, self._statusIcon)
+        self._proxyModel = SearchProxyModel(self._sourceModel)
 
         self._scrollBar = QScrollBar()
         self._list = QListView()
         self._list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self._list.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
+        self._list.setUniformItemSizes(True)
         self._list.setVerticalScrollBar(self._scrollBar)
         self._list.setModel(self._proxyModel)
-        self._list.setItemDelegate(EpisodeItemDelegate(self._list))
+        self._thumbnails = RowThumbnails(self._list, self._proxyModel, self._sourceModel)
+        self._mediaRequests = RowRequests(self._list, self._proxyModel, self._sourceModel, self._hasMediaInfo)
+        self._delegate = EpisodeItemDelegate(self._list, self._statusIcon, self._thumbnails.pixmap, self._detailText)
+        self._list.setItemDelegate(self._delegate)
         self._layout.addWidget(self._list)
 
+    def _createSummary(self) -> None:
+        self._summary = QLabel()
+        self._layout.addWidget(self._summary)
+
+    def _createProgress(self) -> None:
+        self._progress = QProgressBar()
+        self._progress.setTextVisible(False)
+        self._progress.setRange(0, 0)
+        self._progress.hide()
+        self._layout.addWidget(self._progress)
+
     def _createButtons(self) -> None:
         buttonLayout = QHBoxLayout()
         self._back = QPushButton("Back")
@@ -108,19 +203,22 @@ class EpisodeSelect(QWidget):
         self._layout.addLayout(buttonLayout)
 
     def _connectSignals(self) -> None:
-        self._search.textChanged.connect(self._proxyModel.setFilterFixedString)
+        self._search.textChanged.connect(self._proxyModel.setQuery)
         self._back.clicked.connect(self.backClicked)
         self._startAll.clicked.connect(self._onStartAllClicked)
         self._start.clicked.connect(self._onStartClicked)
         self._list.doubleClicked.connect(self._onStartClicked)
         self._list.selectionModel().selectionChanged.connect(self._updateButtonState)
+        self._thumbnails.requested.connect(self.thumbnailsRequested)
+        self._mediaRequests.requested.connect(self.mediaInfoRequested)
         self._updateButtonState()
 
     def _updateButtonState(self) -> None:
         self._start.setDisabled(len(self._list.selectedIndexes()) <= 0)
+        self._startAll.setDisabled(self._sourceModel.rowCount() <= 0)
 
     def _onStartAllClicked(self) -> None:
-        self.episodesSelected.emit(self._episodes)
+        self.episodesSelected.emit(self._sourceModel.items())
 
     def _onStartClicked(self) -> None:
         indexes = self._list.selectedIndexes()
@@ -130,17 +228,98 @@ class EpisodeSelect(QWidget):
         selected = []
         for idx in indexes:
             source_idx = self._proxyModel.mapToSource(idx)
-            selected.append(self._episodes[source_idx.row()])
+            selected.append(self._sourceModel.item(source_idx.row()))
         self.episodesSelected.emit(selected)
 
+    def _statusIcons(self) -> tuple[QPixmap, ...]:
+        return tuple(
+            makePixmap(name, color, STATUS_ICON_SIZE, self.devicePixelRatioF()) for name, color in STATUS_ICONS
+        )
+
+    def _statusIcon(self, episode: Episode) -> QPixmap:
+        unseen, inProgress, completed = self._icons
+        return completed if episode.completed else inProgress if episode.progress > 0 else unseen
+
+    def _hasMediaInfo(self, path: str) -> bool:
+        return path in self._mediaInfo and path not in self._staleMediaInfo
+
+    def _detailText(self, episode: Episode) -> str:
+        info = self._mediaInfo.get(episode.path)
+        if info is None or info.duration <= 0:
+            return ""
+
+        duration = formatDuration(info.duration)
+        if episode.completed:
+            return f"100% · {duration}"
+        if episode.progress > 0:
+            return f"{min(99, int(episode.progress * 100 / info.duration))}% · {duration}"
+        return duration
+
+    def _updateSummary(self) -> None:
+        episodes = self._sourceModel.items()
+        if not episodes:
+            self._summary.clear()
+            return
+
+        watched = sum(1 for e in episodes if e.completed)
+        summary = f"{watched} of {len(episodes)} watched"
+        unwatched = [e for e in episodes if not e.completed]
+        known = [(e, info) for e in unwatched if (info := self._mediaInfo.get(e.path)) is not None]
+        if known:
+            remaining = formatDuration(sum(max(0.0, info.duration - e.progress) for e, info in known))
+            if len(known) == len(unwatched):
+                summary += f" · {remaining} remaining"
+            else:
+                summary += f" · ≥ {remaining} remaining ({len(known)} of {len(unwatched)} known)"
+        self._summary.setText(summary)
+
+    def _requestDurations(self) -> None:
+        self.durationsRequested.emit([e for e in self._sourceModel.items() if not e.completed])
+
+    def changeEvent(self, event: QEvent | None) -> None:
+        super().changeEvent(event)
+        if event is not None and event.type() in STATUS_ICON_EVENTS:
+            self._icons = self._statusIcons()
+            self._delegate.invalidateLayout()
+            self._list.viewport().update()
+
+    @traced("setEpisodes")
     def setEpisodes(self, episodes: list[Episode]) -> None:
-        self._episodes = episodes
-        self._sourceModel.clear()
         self._search.clear()
-        unseen = makeIcon("circle", QPalette.ColorRole.PlaceholderText)
-        inProgress = makeIcon("clock", QPalette.ColorRole.Text)
-        completed = makeIcon("check-circle", QPalette.ColorRole.BrightText)
-        for episode in episodes:
-            icon = completed if episode.completed else inProgress if episode.progress > 0 else unseen
-            item = QStandardItem(icon, episode.name)
-            self._sourceModel.appendRow(item)
+        self._mediaInfo.clear()
+        self._staleMediaInfo.clear()
+        self._mediaRequests.clear()
+        self._thumbnails.clear()
+        self._sourceModel.setItems(episodes)
+        self._updateButtonState()
+        self._updateSummary()
+        self._requestDurations()
+
+    @traced("updateEpisodes")
+    def updateEpisodes(self, episodes: list[Episode]) -> None:
+        self._staleMediaInfo = set(self._mediaInfo)
+        self._mediaRequests.clear()
+        self._mediaRequests.schedule()
+        self._sourceModel.updateItems(episodes)
+        self._updateButtonState()
+        self._updateSummary()
+        self._requestDurations()
+
+    def setMediaInfo(self, items: list[tuple[str, MediaInfo | None]]) -> None:
+        self._mediaInfo.update(items)
+        paths = {path for path, _ in items}
+        self._staleMediaInfo.difference_update(paths)
+        self._mediaRequests.resolve(paths)
+        self._sourceModel.refreshItems(paths)
+        self._updateSummary()
+
+    def setThumbnails(self, images: list[tuple[Episode, QImage | None]]) -> None:
+        self._thumbnails.setImages(images)
+
+    def setBusy(self, busy: bool) -> None:
+        self._progress.setRange(0, 0)
+        self._progress.setVisible(busy)
+
+    def setProgress(self, done: int, total: int) -> None:
+        self._progress.setRange(0, total)
+        self._progress.setValue(done)
@@ -0,0 +1,86 @@
+import bisect
+import time
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+FRAME_INTERVAL_MS = 16
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0)
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total = 0.0
+
+    def add(self, milliseconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.total += milliseconds
+
+    def buckets(self) -> dict[str, float]:
+        labels = [f"<{b:g}ms" for b in LATENCY_BUCKETS_MS] + [f">={LATENCY_BUCKETS_MS[-1]:g}ms"]
+        return {**dict(zip(labels, self.counts, strict=True)), "total_ms": round(self.total, 3)}
+
+
+class InputForwarder(QObject):
+    moved = pyqtSignal()
+
+    def __init__(self, command: Callable[..., object], interval: int = FRAME_INTERVAL_MS) -> None:
+        super().__init__()
+        self._command = command
+        self._interval = interval
+        self._queue: list[tuple] = []
+        self._queuedAt = 0.0
+        self._lastFlush = 0.0
+        self.counters = {"received": 0, "forwarded": 0, "dropped": 0}
+        self.delay = LatencyHistogram()
+        self.calls = LatencyHistogram()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def setInterval(self, interval: int) -> None:
+        self._interval = interval
+
+    def moveTo(self, x: int, y: int) -> None:
+        self.counters["received"] += 1
+        if self._queue and self._queue[-1][0] == "mouse":
+            self._queue[-1] = ("mouse", x, y)
+            self.counters["dropped"] += 1
+            return
+        self._enqueue(("mouse", x, y))
+
+    def send(self, *command: str) -> None:
+        self.counters["received"] += 1
+        self._enqueue(command)
+
+    def flush(self) -> None:
+        self._timer.stop()
+        queue = self._queue
+        self._queue = []
+        if not queue:
+            return
+
+        now = time.perf_counter()
+        self.delay.add((now - self._queuedAt) * 1000)
+        self._lastFlush = now
+        for command in queue:
+            start = time.perf_counter()
+            try:
+                self._command(*command)
+            except SystemError as e:
+                print(f"Failed to forward {command[0]}: {e}")
+            self.calls.add((time.perf_counter() - start) * 1000)
+        self.counters["forwarded"] += len(queue)
+
+        if any(command[0] == "mouse" for command in queue):
+            self.moved.emit()
+
+    def _enqueue(self, command: tuple) -> None:
+        if not self._queue:
+            self._queuedAt = time.perf_counter()
+        self._queue.append(command)
+        if not self._timer.isActive():
+            elapsed = (time.perf_counter() - self._lastFlush) * 1000
+            self._timer.start(max(0, round(self._interval - elapsed)))
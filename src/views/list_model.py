@@ -0,0 +1,165 @@
+import bisect
+from collections.abc import Callable, Hashable
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, Qt, pyqtSignal
+
+VALUE_ROLE = Qt.ItemDataRole.UserRole + 1
+PAGE_SIZE = 500
+
+
+class ListModel(QAbstractListModel):
+    itemsAdded = pyqtSignal(list)
+    itemsRemoved = pyqtSignal(list)
+
+    def __init__(
+        self,
+        key: Callable[[object], Hashable],
+        display: Callable[[object], str],
+        decoration: Callable[[object], object] | None = None,
+        sortKey: Callable[[object], object] | None = None,
+    ) -> None:
+        super().__init__()
+        self._key = key
+        self._display = display
+        self._decoration = decoration
+        self._sortKey = sortKey
+        self._items: list = []
+        self._keys: set[Hashable] = set()
+        self._fetched = 0
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else self._fetched
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> bool:
+        return not parent.isValid() and self._fetched < len(self._items)
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> None:
+        if not parent.isValid():
+            self._fetch(min(len(self._items), self._fetched + PAGE_SIZE))
+
+    def _fetch(self, count: int) -> None:
+        if count <= self._fetched:
+            return
+
+        self.beginInsertRows(QModelIndex(), self._fetched, count - 1)
+        self._fetched = count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(item)
+        if role == Qt.ItemDataRole.DecorationRole and self._decoration is not None:
+            return self._decoration(item)
+        if role == VALUE_ROLE:
+            return item
+        return None
+
+    def items(self) -> list:
+        return list(self._items)
+
+    def item(self, row: int) -> object:
+        return self._items[row]
+
+    def key(self, item: object) -> Hashable:
+        return self._key(item)
+
+    def text(self, item: object) -> str:
+        return self._display(item)
+
+    def setItems(self, items: list) -> None:
+        self.beginResetModel()
+        self._items = list(items) if self._sortKey is None else sorted(items, key=self._sortKey)
+        self._keys = {self._key(i) for i in self._items}
+        self._fetched = min(len(self._items), PAGE_SIZE)
+        self.endResetModel()
+
+    def appendItems(self, items: list) -> None:
+        keys: set[Hashable] = set()
+        added: list = []
+        for item in items:
+            key = self._key(item)
+            if key not in self._keys and key not in keys:
+                keys.add(key)
+                added.append(item)
+        if not added:
+            return
+
+        self._keys.update(keys)
+        limit = max(self._fetched, PAGE_SIZE) if self._fetched == len(self._items) else self._fetched
+        if self._sortKey is None:
+            self._insertRows(len(self._items), added, limit)
+        else:
+            groups: dict[int, list] = {}
+            for item in sorted(added, key=self._sortKey):
+                row = bisect.bisect_right(self._items, self._sortKey(item), key=self._sortKey)
+                groups.setdefault(row, []).append(item)
+            for row in sorted(groups, reverse=True):
+                self._insertRows(row, groups[row], limit)
+        self.itemsAdded.emit(added)
+
+    def _insertRows(self, row: int, items: list, limit: int) -> None:
+        visible = min(len(items), max(0, limit - row))
+        if visible > 0:
+            self.beginInsertRows(QModelIndex(), row, row + visible - 1)
+            self._items[row:row] = items[:visible]
+            self._fetched += visible
+            self.endInsertRows()
+        if self._fetched > limit:
+            self.beginRemoveRows(QModelIndex(), limit, self._fetched - 1)
+            self._fetched = limit
+            self.endRemoveRows()
+        self._items[row + visible : row + visible] = items[visible:]
+
+    def removeItems(self, items: list) -> None:
+        keys = {self._key(i) for i in items} & self._keys
+        if not keys:
+            return
+
+        rows = [row for row, item in enumerate(self._items) if self._key(item) in keys]
+        removed = [self._items[row] for row in rows]
+        for first, last in reversed(self._ranges(rows)):
+            fetchedLast = min(last, self._fetched - 1)
+            del self._items[max(first, fetchedLast + 1) : last + 1]
+            if first > fetchedLast:
+                continue
+
+            self.beginRemoveRows(QModelIndex(), first, fetchedLast)
+            del self._items[first : fetchedLast + 1]
+            self._fetched -= fetchedLast - first + 1
+            self.endRemoveRows()
+        self._keys.difference_update(keys)
+        self.itemsRemoved.emit(removed)
+
+    def updateItems(self, items: list) -> None:
+        updated = {self._key(i): i for i in items}
+        self.removeItems([i for i in self._items if self._key(i) not in updated])
+
+        changed: list[int] = []
+        for row, item in enumerate(self._items):
+            current = updated.pop(self._key(item))
+            if current != item:
+                self._items[row] = current
+                if row < self._fetched:
+                    changed.append(row)
+        for first, last in self._ranges(changed):
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+        self.appendItems([i for i in items if self._key(i) in updated])
+
+    def refreshItems(self, keys: set[Hashable]) -> None:
+        rows = [row for row in range(self._fetched) if self._key(self._items[row]) in keys]
+        for first, last in self._ranges(rows):
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def _ranges(self, rows: list[int]) -> list[tuple[int, int]]:
+        ranges: list[tuple[int, int]] = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1] = (ranges[-1][0], row)
+            else:
+                ranges.append((row, row))
+        return ranges
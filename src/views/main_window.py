@@ -8,6 +8,7 @@ from views.title_select import TitleSelect
 
 WINDOW_MIN_WIDTH = 800
 WINDOW_MIN_HEIGHT = 600
+WINDOW_ICON = "_internal/icon.ico"
 
 
 class MainWindow(QMainWindow):
@@ -15,7 +16,6 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Quickplay")
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
-        self.setWindowIcon(QIcon("_internal/icon.ico"))
 
         self.titleSelect = TitleSelect(self)
         self.episodeSelect = EpisodeSelect(self)
@@ -28,5 +28,8 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(self._stackedWidget)
 
+    def loadIcon(self) -> None:
+        self.setWindowIcon(QIcon(WINDOW_ICON))
+
     def setPage(self, page: Page) -> None:
         self._stackedWidget.setCurrentIndex(page)
@@ -1,11 +1,16 @@
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QPushButton, QVBoxLayout, QWidget
 
+import tracing
+from services.mpv_backend import MpvBackend
 from views.video_player import VideoPlayer
 
 
 class PlayerPage(QWidget):
     stopRequested = pyqtSignal()
+    playerCreated = pyqtSignal(object)
+
+    player: VideoPlayer | None
 
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
@@ -13,12 +18,16 @@ class PlayerPage(QWidget):
         self._layout = QVBoxLayout()
         self.setLayout(self._layout)
 
-        self._createPlayer()
+        self.player = None
         self._createButtons()
 
-    def _createPlayer(self) -> None:
-        self.player = VideoPlayer()
-        self._layout.addWidget(self.player)
+    def ensurePlayer(self) -> VideoPlayer:
+        if self.player is None:
+            with tracing.span("createPlayer"):
+                self.player = VideoPlayer(MpvBackend)
+            self._layout.insertWidget(0, self.player)
+            self.playerCreated.emit(self.player)
+        return self.player
 
     def _createButtons(self) -> None:
         self._buttonFrame = QFrame()
@@ -0,0 +1,80 @@
+from collections.abc import Callable, Hashable
+
+from PyQt6.QtCore import QEvent, QObject, QPoint, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QListView
+
+from views.list_model import ListModel
+from views.search_proxy_model import SearchProxyModel
+
+REQUEST_DELAY_MS = 100
+NEARBY_ROWS = 20
+REQUEST_LIMIT = 128
+
+
+class RowRequests(QObject):
+    requested = pyqtSignal(list)
+
+    def __init__(
+        self, view: QListView, proxy: SearchProxyModel, model: ListModel, isLoaded: Callable[[Hashable], bool]
+    ) -> None:
+        super().__init__(view)
+        self._view = view
+        self._proxy = proxy
+        self._model = model
+        self._isLoaded = isLoaded
+        self._pending: set[Hashable] = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(REQUEST_DELAY_MS)
+        self._timer.timeout.connect(self._request)
+
+        view.verticalScrollBar().valueChanged.connect(self.schedule)
+        view.viewport().installEventFilter(self)
+        proxy.modelReset.connect(self.schedule)
+        proxy.layoutChanged.connect(self.schedule)
+        proxy.rowsInserted.connect(self.schedule)
+        proxy.rowsRemoved.connect(self.schedule)
+
+    def eventFilter(self, watched: QObject | None, event: QEvent | None) -> bool:
+        if event is not None and event.type() in (QEvent.Type.Resize, QEvent.Type.Show):
+            self.schedule()
+        return False
+
+    def schedule(self) -> None:
+        self._timer.start()
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def resolve(self, keys: set[Hashable]) -> None:
+        self._pending.difference_update(keys)
+
+    def _request(self) -> None:
+        items: list = []
+        keys: set[Hashable] = set()
+        for row in self._rows():
+            item = self._model.item(self._proxy.mapToSource(self._proxy.index(row, 0)).row())
+            key = self._model.key(item)
+            if not self._isLoaded(key):
+                items.append(item)
+                keys.add(key)
+                if len(items) >= REQUEST_LIMIT:
+                    break
+
+        if keys != self._pending:
+            self._pending = keys
+            self.requested.emit(items)
+
+    def _rows(self) -> list[int]:
+        rect = self._view.viewport().rect()
+        first = self._view.indexAt(rect.topLeft())
+        if not first.isValid():
+            return []
+
+        count = self._proxy.rowCount()
+        last = self._view.indexAt(QPoint(rect.left(), rect.bottom()))
+        end = last.row() + 1 if last.isValid() else count
+        below = range(end, min(count, end + NEARBY_ROWS))
+        above = range(first.row() - 1, max(-1, first.row() - 1 - NEARBY_ROWS), -1)
+        return [*range(first.row(), end), *below, *above]
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from PyQt6.QtCore import QObject, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QListView
+
+from views.list_model import ListModel
+from views.row_requests import RowRequests
+from views.search_proxy_model import SearchProxyModel
+
+THUMBNAIL_SIZE = QSize(48, 27)
+PIXMAP_CACHE_SIZE = 512
+
+
+class RowThumbnails(QObject):
+    requested = pyqtSignal(list, QSize)
+
+    def __init__(self, view: QListView, proxy: SearchProxyModel, model: ListModel) -> None:
+        super().__init__(view)
+        self._view = view
+        self._model = model
+        self._pixmaps: OrderedDict[Hashable, QPixmap] = OrderedDict()
+        self._placeholder = QPixmap(THUMBNAIL_SIZE)
+        self._placeholder.fill(Qt.GlobalColor.transparent)
+        self._requests = RowRequests(view, proxy, model, self._pixmaps.__contains__)
+        self._requests.requested.connect(self._onRequested)
+
+    def pixmap(self, item: object) -> QPixmap:
+        key = self._model.key(item)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            return self._placeholder
+
+        self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._requests.clear()
+
+    def setImages(self, images: list[tuple[object, QImage | None]]) -> None:
+        ratio = self._view.devicePixelRatioF()
+        keys: set[Hashable] = set()
+        for item, image in images:
+            key = self._model.key(item)
+            if image is None or image.isNull():
+                self._pixmaps[key] = self._placeholder
+            else:
+                pixmap = QPixmap.fromImage(image)
+                pixmap.setDevicePixelRatio(ratio)
+                self._pixmaps[key] = pixmap
+            self._pixmaps.move_to_end(key)
+            keys.add(key)
+
+        while len(self._pixmaps) > PIXMAP_CACHE_SIZE:
+            self._pixmaps.popitem(last=False)
+        self._requests.resolve(keys)
+        self._model.refreshItems(keys)
+
+    def _onRequested(self, items: list) -> None:
+        ratio = self._view.devicePixelRatioF()
+        self.requested.emit(items, QSize(round(THUMBNAIL_SIZE.width() * ratio), round(THUMBNAIL_SIZE.height() * ratio)))
@@ -0,0 +1,94 @@
+from collections.abc import Hashable
+
+from PyQt6.QtCore import QModelIndex, QPersistentModelIndex, QSortFilterProxyModel, QTimer
+
+from services.search_index import SearchIndex
+from views.list_model import ListModel
+
+SEARCH_DEBOUNCE_MS = 150
+RANK_LIMIT = 2000
+MATCH_FETCH_SIZE = 100
+
+
+class SearchProxyModel(QSortFilterProxyModel):
+    def __init__(self, model: ListModel) -> None:
+        super().__init__()
+        self._model = model
+        self._index = SearchIndex()
+        self._indexed = False
+        self._query = ""
+        self._scores: dict[Hashable, float] | None = None
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(SEARCH_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._applyQuery)
+
+        self.setSourceModel(model)
+        model.modelReset.connect(self._onModelReset)
+        model.itemsAdded.connect(self._onItemsAdded)
+        model.itemsRemoved.connect(self._onItemsRemoved)
+        self._onModelReset()
+
+    def setQuery(self, query: str) -> None:
+        self._query = query
+        if query.strip():
+            self._debounce.start()
+        else:
+            self._debounce.stop()
+            self._applyQuery()
+
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QModelIndex | QPersistentModelIndex) -> bool:
+        return self._scores is None or self._model.key(self._model.item(sourceRow)) in self._scores
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> None:
+        if self._scores is None:
+            super().fetchMore(parent)
+        elif not parent.isValid():
+            self._fetchMatches(self.rowCount() + MATCH_FETCH_SIZE)
+
+    def lessThan(self, left: QModelIndex | QPersistentModelIndex, right: QModelIndex | QPersistentModelIndex) -> bool:
+        scores = self._scores or {}
+        leftScore = scores.get(self._model.key(self._model.item(left.row())), 0.0)
+        rightScore = scores.get(self._model.key(self._model.item(right.row())), 0.0)
+        return leftScore > rightScore
+
+    def _applyQuery(self) -> None:
+        self._debounce.stop()
+        if not self._indexed and self._query.strip():
+            self._index.setEntries((self._model.key(item), self._model.text(item)) for item in self._model.items())
+            self._indexed = True
+        scores = self._index.search(self._query)
+        if scores is None and self._scores is None:
+            return
+
+        self._scores = scores
+        self.invalidateRowsFilter()
+        self.sort(0 if scores is not None and len(scores) <= RANK_LIMIT else -1)
+        self._fetchMatches(MATCH_FETCH_SIZE)
+
+    def _fetchMatches(self, count: int) -> None:
+        if self._scores is None:
+            return
+
+        count = min(count, len(self._scores))
+        while self.rowCount() < count and self._model.canFetchMore(QModelIndex()):
+            self._model.fetchMore(QModelIndex())
+
+    def _onModelReset(self) -> None:
+        self._index.clear()
+        self._indexed = False
+        if self._scores is not None:
+            self._applyQuery()
+
+    def _onItemsAdded(self, items: list) -> None:
+        if not self._indexed:
+            return
+
+        self._index.addEntries((self._model.key(item), self._model.text(item)) for item in items)
+        if self._scores is not None:
+            self._debounce.start()
+
+    def _onItemsRemoved(self, items: list) -> None:
+        if self._indexed:
+            self._index.removeEntries(self._model.key(item) for item in items)
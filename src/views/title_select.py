@@ -1,16 +1,29 @@
-from PyQt6.QtCore import QSortFilterProxyModel, Qt, pyqtSignal
-from PyQt6.QtGui import QStandardItem, QStandardItemModel
-from PyQt6.QtWidgets import QHBoxLayout, QLineEdit, QListView, QPushButton, QScrollBar, QVBoxLayout, QWidget
+from PyQt6.QtCore import QSize, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import (
+    QHBoxLayout,
+    QLineEdit,
+    QListView,
+    QProgressBar,
+    QPushButton,
+    QScrollBar,
+    QVBoxLayout,
+    QWidget,
+)
 
 from models.title import Title
-
-TITLE_VALUE_ROLE = Qt.ItemDataRole.UserRole + 1
+from tracing import traced
+from views.list_model import ListModel
+from views.row_thumbnails import THUMBNAIL_SIZE, RowThumbnails
+from views.search_proxy_model import SearchProxyModel
 
 
 class TitleSelect(QWidget):
     titleSelected = pyqtSignal(Title)
     startPreviousClicked = pyqtSignal()
     startPreviousDisabled = pyqtSignal(bool)
+    rescanClicked = pyqtSignal()
+    thumbnailsRequested = pyqtSignal(list, QSize)
 
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
@@ -20,6 +33,7 @@ class TitleSelect(QWidget):
 
         self._createSearch()
         self._createTitleList()
+        self._createProgress()
         self._createButtons()
         self._connectSignals()
 
@@ -29,33 +43,50 @@ class TitleSelect(QWidget):
         self._layout.addWidget(self._search)
 
     def _createTitleList(self) -> None:
-        self._sourceModel = QStandardItemModel()
-        self._proxyModel = QSortFilterProxyModel()
-        self._proxyModel.setSourceModel(self._sourceModel)
-        self._proxyModel.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._sourceModel = ListModel(
+            lambda t: (t.base, t.name),
+            lambda t: t.name,
+            self._thumbnail,
+            sortKey=lambda t: t.name.casefold(),
+        )
+        self._proxyModel = SearchProxyModel(self._sourceModel)
 
         self._scrollBar = QScrollBar()
         self._list = QListView()
         self._list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self._list.setUniformItemSizes(True)
         self._list.setVerticalScrollBar(self._scrollBar)
+        self._list.setIconSize(THUMBNAIL_SIZE)
         self._list.setModel(self._proxyModel)
+        self._thumbnails = RowThumbnails(self._list, self._proxyModel, self._sourceModel)
         self._layout.addWidget(self._list)
 
+    def _createProgress(self) -> None:
+        self._progress = QProgressBar()
+        self._progress.setTextVisible(False)
+        self._progress.setRange(0, 0)
+        self._progress.hide()
+        self._layout.addWidget(self._progress)
+
     def _createButtons(self) -> None:
         buttonLayout = QHBoxLayout()
         self._startPrevious = QPushButton("Start previous")
+        self._rescan = QPushButton("Rescan")
         self._next = QPushButton("Next")
         buttonLayout.addWidget(self._startPrevious)
+        buttonLayout.addWidget(self._rescan)
         buttonLayout.addWidget(self._next)
         self._layout.addLayout(buttonLayout)
 
     def _connectSignals(self) -> None:
-        self._search.textChanged.connect(self._proxyModel.setFilterFixedString)
+        self._search.textChanged.connect(self._proxyModel.setQuery)
         self._next.clicked.connect(self._onNextClicked)
         self._startPrevious.clicked.connect(self.startPreviousClicked)
+        self._rescan.clicked.connect(self.rescanClicked)
         self._list.doubleClicked.connect(self._onNextClicked)
         self._list.selectionModel().selectionChanged.connect(self._updateButtonState)
         self.startPreviousDisabled.connect(self._startPrevious.setDisabled)
+        self._thumbnails.requested.connect(self.thumbnailsRequested)
         self._updateButtonState()
 
     def _updateButtonState(self) -> None:
@@ -67,16 +98,33 @@ class TitleSelect(QWidget):
             return
 
         source_index = self._proxyModel.mapToSource(indexes[0])
-        item = self._sourceModel.item(source_index.row())
-        title: Title = item.data(TITLE_VALUE_ROLE)
+        title: Title = self._sourceModel.item(source_index.row())
         self.titleSelected.emit(title)
 
+    def _thumbnail(self, title: Title) -> QPixmap:
+        return self._thumbnails.pixmap(title)
+
+    @traced("setTitles")
     def setTitles(self, titles: list[Title]) -> None:
-        self._sourceModel.clear()
-        for title in titles:
-            item = QStandardItem(title.name)
-            item.setData(title, TITLE_VALUE_ROLE)
-            self._sourceModel.appendRow(item)
+        self._thumbnails.clear()
+        self._sourceModel.setItems(titles)
+
+    def appendTitles(self, titles: list[Title]) -> None:
+        self._sourceModel.appendItems(titles)
+
+    def removeTitles(self, titles: list[Title]) -> None:
+        self._sourceModel.removeItems(titles)
+
+    def setThumbnails(self, images: list[tuple[Title, QImage | None]]) -> None:
+        self._thumbnails.setImages(images)
 
     def hasSelection(self) -> bool:
         return len(self._list.selectedIndexes()) > 0
+
+    def setBusy(self, busy: bool) -> None:
+        self._progress.setRange(0, 0)
+        self._progress.setVisible(busy)
+
+    def setProgress(self, done: int, total: int) -> None:
+        self._progress.setRange(0, total)
+        self._progress.setValue(done)
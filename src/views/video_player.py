@@ -1,21 +1,29 @@
-import os
+from collections.abc import Callable
 
-from models.episode import EpisodeConfig
-
-os.environ["PATH"] = os.path.dirname("./_internal/libmpv-2.dll") + os.pathsep + os.environ["PATH"]
-import mpv
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QKeyEvent, QMouseEvent, QWheelEvent
+from PyQt6.QtGui import QKeyEvent, QMouseEvent, QShowEvent, QWheelEvent
 from PyQt6.QtWidgets import QWidget
 
+import tracing
+from models.episode import Episode, EpisodeConfig
+from services.player_backend import PlayerBackend
+from views.input_forwarder import InputForwarder
+from workers.event_channel import EventChannel
+
+RESUME_TOLERANCE = 1.0
+
 
 class VideoPlayer(QWidget):
     isFullscreen = pyqtSignal(bool)
     quitEvent = pyqtSignal()
+    remainingChanged = pyqtSignal(float)
 
-    player: mpv.MPV
+    player: PlayerBackend
     episodeConfig: EpisodeConfig
     loadingEpisodes: bool
+    events: EventChannel
+    input: InputForwarder
+    playlistWindow: int
 
     keyboardKeys: dict[Qt.Key, str] = {
         Qt.Key.Key_Escape: "ESC",
@@ -55,36 +63,51 @@ class VideoPlayer(QWidget):
         Qt.MouseButton.RightButton: "MOUSE_BTN2",
     }
 
-    def __init__(self) -> None:
+    def __init__(self, createBackend: Callable[[str], PlayerBackend]) -> None:
         super().__init__()
         self.setAttribute(Qt.WidgetAttribute.WA_NativeWindow)
         self.setAttribute(Qt.WidgetAttribute.WA_DontCreateNativeAncestors)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setMouseTracking(True)
         self._initCursorTimer()
-        self._initPlayer()
+        self._initEvents()
+        self._initPlayer(createBackend)
+        self._initInput()
         self.loadingEpisodes = False
-
-    def _initPlayer(self) -> None:
-        self.player = mpv.MPV(
-            wid=str(int(self.winId())),
-            ytdl=True,
-            input_cursor=True,
-            input_default_bindings=True,
-            input_vo_keyboard=True,
-            osc=True,
-        )
-        self.player.on_key_press("n")(self._nextItem)
-        self.player.on_key_press("N")(self._nextChapter)
-        self.player.on_key_press("p")(self._previousItem)
-        self.player.on_key_press("P")(self._previousChapter)
-        self.player.on_key_press("Ctrl+l")(self._showList)
+        self.playlistWindow = 0
+        self._windowStart = 0
+        self._windowEnd = 0
+        self._duration = 0.0
+        self._starts: dict[str, float] = {}
+        self._frameToken: tuple[str, float, int] | None = None
+        self._awaitingFrame = False
+        self._seekTarget: float | None = None
+        self._timePos = 0.0
+
+    def _initPlayer(self, createBackend: Callable[[str], PlayerBackend]) -> None:
+        self.player = createBackend(str(int(self.winId())))
+        self.player.onKeyPress("n", lambda: self.events.post("next-item", None))
+        self.player.onKeyPress("N", self._nextChapter)
+        self.player.onKeyPress("p", lambda: self.events.post("previous-item", None))
+        self.player.onKeyPress("P", self._previousChapter)
+        self.player.onKeyPress("Ctrl+l", self._showList)
         for key in ("q", "Q", "POWER", "STOP"):
-            self.player.on_key_press(key)(self.quitEvent.emit)
-        self.player.observe_property("fullscreen", lambda _, value: self.isFullscreen.emit(value))
-        self.player.observe_property("playlist-pos", lambda _, value: self._updateEpisodeConfig(value))
-        self.player.observe_property("time-pos", lambda _, value: self._updateProgress(value))
-        self.player.event_callback("file-loaded")(lambda _: self._syncTimePos())
+            self.player.onKeyPress(key, self.quitEvent.emit)
+        self.player.observe("fullscreen", lambda _, value: self.isFullscreen.emit(value))
+        self.player.observe("playlist-pos", self.events.post)
+        self.player.observe("time-pos", self._postTimePos)
+        self.player.observe("duration", self.events.post)
+        self.player.onEvent("file-loaded", lambda: self.events.post("file-loaded", None))
+        self.player.onEvent("playback-restart", lambda: self.events.post("playback-restart", None))
+
+    def _initInput(self) -> None:
+        self.input = InputForwarder(self.player.command)
+        self.input.moved.connect(self._showCursor)
+        self._updateFrameInterval()
+
+    def _initEvents(self) -> None:
+        self.events = EventChannel({"time-pos"})
+        self.events.received.connect(self._onEvent)
 
     def _initCursorTimer(self) -> None:
         self.cursorTimer = QTimer(self)
@@ -92,9 +115,22 @@ class VideoPlayer(QWidget):
         self.cursorTimer.setInterval(1000)
         self.cursorTimer.timeout.connect(lambda: self.setCursor(Qt.CursorShape.BlankCursor))
 
+    def _showCursor(self) -> None:
+        self.unsetCursor()
+        self.cursorTimer.start()
+
+    def _updateFrameInterval(self) -> None:
+        screen = self.screen()
+        if screen is not None and screen.refreshRate() > 0:
+            self.input.setInterval(max(1, round(1000 / screen.refreshRate())))
+
     def _nextItem(self) -> None:
-        if self.player.playlist_pos < len(self.player.playlist) - 1:
-            self.player.playlist_next()
+        position = self.player.playlistPosition()
+        if self.playlistWindow > 0 and position == self.player.playlistCount() - 1:
+            end = min(len(self.episodeConfig.episodes), self._windowEnd + self.playlistWindow)
+            self._growWindow(self._windowStart, end)
+        if position < self.player.playlistCount() - 1:
+            self.player.next()
 
     def _nextChapter(self) -> None:
         try:
@@ -103,8 +139,12 @@ class VideoPlayer(QWidget):
             print("No chapters in video.")
 
     def _previousItem(self) -> None:
-        if self.player.playlist_pos > 0:
-            self.player.playlist_prev()
+        position = self.player.playlistPosition()
+        if self.playlistWindow > 0 and position == 0 and self._windowStart > 0:
+            self._growWindow(max(0, self._windowStart - self.playlistWindow), self._windowEnd)
+            position = self.player.playlistPosition()
+        if position > 0:
+            self.player.previous()
 
     def _previousChapter(self) -> None:
         try:
@@ -131,60 +171,175 @@ class VideoPlayer(QWidget):
         if event is None:
             return
 
-        x = event.pos().x()
-        y = event.pos().y()
-        self.player.command("mouse", x, y)
+        self.input.moveTo(event.pos().x(), event.pos().y())
 
         button = self.mouseKeys.get(event.button())
         if button is not None:
             prefix = self._modifierPrefix(event.modifiers())
-            self.player.command("keyup" if release else "keydown", prefix + button)
+            self.input.send("keyup" if release else "keydown", prefix + button)
+
+    def _postTimePos(self, name: str, value: float | None) -> None:
+        if value is not None:
+            self.events.post(name, value)
+
+    def _onEvent(self, name: str, value: object) -> None:
+        if name == "time-pos":
+            self._updateProgress(value)
+        elif name == "playlist-pos":
+            self._updateEpisodeConfig(value)
+        elif name == "duration":
+            self._duration = value or 0.0
+        elif name == "file-loaded":
+            self._awaitingFrame = True
+            self._syncTimePos()
+        elif name == "playback-restart":
+            self._onPlaybackRestart()
+        elif name == "next-item":
+            self._nextItem()
+        elif name == "previous-item":
+            self._previousItem()
+
+    def _onPlaybackRestart(self) -> None:
+        if not self._awaitingFrame:
+            return
+        if self._seekTarget is not None and abs(self._timePos - self._seekTarget) > RESUME_TOLERANCE:
+            return
 
-    def _updateEpisodeConfig(self, index: int) -> None:
+        self._awaitingFrame = False
+        self._seekTarget = None
+        token, self._frameToken = self._frameToken, None
+        tracing.end(token)
+
+    def _updateEpisodeConfig(self, position: int) -> None:
         if self.loadingEpisodes:
             self.loadingEpisodes = False
             return
 
+        if self.playlistWindow > 0 and position != -1:
+            position = self.player.playlistPosition()
+            if position == -1:
+                return
+
+        index = position if position == -1 else position + self._windowStart
         try:
-            if index != 0 and 0 <= index - 1 < len(self.episodeConfig.episodes):
-                self.episodeConfig.episodes[index - 1].progress = 0.0
-                self.episodeConfig.episodes[index - 1].completed = True
+            first = index - 1
+            if self.playlistWindow > 0 and self.episodeConfig.index < index:
+                first = self.episodeConfig.index
+            for row in range(max(0, first), index):
+                self.episodeConfig.episodes[row].progress = 0.0
+                self.episodeConfig.episodes[row].completed = True
 
             if index == -1:
                 self.episodeConfig.episodes[index].progress = 0.0
                 self.episodeConfig.episodes[index].completed = True
                 self.quitEvent.emit()
             else:
+                if index != self.episodeConfig.index:
+                    self._frameToken = tracing.begin("episodeTransition")
+                    tracing.count("episodeTransitions")
                 self.episodeConfig.index = index
+                self._moveWindow(index)
 
         except AttributeError:
             print("No episode config.")
 
     def _updateProgress(self, progress: float) -> None:
         if progress is not None:
+            self._timePos = progress
             self.episodeConfig.episodes[self.episodeConfig.index].progress = progress
+            if self._duration > 0:
+                self.remainingChanged.emit(self._duration - progress)
 
     def _syncTimePos(self) -> None:
-        self.player.time_pos = self.episodeConfig.currentEpisode().progress
+        episode = self.episodeConfig.currentEpisode()
+        self._seekTarget = None
+        if abs(episode.progress - self._starts.get(episode.path, 0.0)) > RESUME_TOLERANCE:
+            self._seekTarget = episode.progress
+            self.player.seek(episode.progress)
+
+    def _appendEpisodes(self, episodes: list[Episode]) -> None:
+        paths: list[str] = []
+        for episode in episodes:
+            if episode.progress <= 0 and "\n" not in episode.path:
+                paths.append(episode.path)
+                self._starts.pop(episode.path, None)
+                continue
+
+            self.player.appendFiles(paths)
+            paths = []
+            if episode.progress > 0:
+                self.player.appendFile(episode.path, episode.progress)
+                self._starts[episode.path] = episode.progress
+            else:
+                self.player.appendFile(episode.path)
+        self.player.appendFiles(paths)
+
+    def _moveWindow(self, index: int) -> None:
+        if self.playlistWindow <= 0:
+            return
 
+        start = max(0, index - self.playlistWindow)
+        end = min(len(self.episodeConfig.episodes), index + self.playlistWindow + 1)
+        self._growWindow(start, end)
+
+        while self._windowEnd > max(end, self._windowStart + 1):
+            self.player.removeEntry(self._windowEnd - self._windowStart - 1)
+            self._windowEnd -= 1
+        while self._windowStart < start:
+            self.player.removeEntry(0)
+            self._windowStart += 1
+
+    def _growWindow(self, start: int, end: int) -> None:
+        episodes = self.episodeConfig.episodes
+        if end > self._windowEnd:
+            self._appendEpisodes(episodes[self._windowEnd : end])
+            self._windowEnd = end
+
+        if start < self._windowStart:
+            count = self._windowStart - start
+            loaded = self._windowEnd - self._windowStart
+            self._appendEpisodes(episodes[start : self._windowStart])
+            for i in range(count):
+                self.player.moveEntry(loaded + i, i)
+            self._windowStart = start
+
+    def setEventInterval(self, interval: int) -> None:
+        self.events.setInterval(interval)
+
+    def setPlaylistWindow(self, size: int) -> None:
+        self.playlistWindow = size
+
+    @tracing.traced("loadEpisodes")
     def loadEpisodes(self, config: EpisodeConfig) -> None:
+        self.events.flush()
+        self._frameToken = tracing.begin("firstFrame")
         self.loadingEpisodes = True
         self.player.keypress("ESC")
         self.player.stop()
-        self.player.playlist_clear()
+        self.player.clearPlaylist()
 
-        for episode in config.episodes:
-            self.player.playlist_append(episode.path)
-
-        self.player.pause = True
-        self.player.playlist_pos = config.index
         self.episodeConfig = config
+        self._starts.clear()
+        if self.playlistWindow > 0:
+            self._windowStart = max(0, config.index - self.playlistWindow)
+            self._windowEnd = min(len(config.episodes), config.index + self.playlistWindow + 1)
+        else:
+            self._windowStart, self._windowEnd = 0, len(config.episodes)
+        self._appendEpisodes(config.episodes[self._windowStart : self._windowEnd])
+
+        self.player.setPaused(True)
+        self.player.setPlaylistPosition(config.index - self._windowStart)
 
     def start(self) -> None:
-        self.player.pause = False
+        self.player.setPaused(False)
 
     def stop(self) -> None:
-        self.player.pause = True
+        self.player.setPaused(True)
+        self.events.flush()
+        tracing.setCounters("events", self.events.counters)
+        tracing.setCounters("input", self.input.counters)
+        tracing.setCounters("input.delay", self.input.delay.buckets())
+        tracing.setCounters("input.calls", self.input.calls.buckets())
 
     def keyPressEvent(self, event: QKeyEvent | None) -> None:
         if event is None:
@@ -205,11 +360,13 @@ class VideoPlayer(QWidget):
             key = event.text()
 
         if key is not None:
-            self.player.keypress(key)
+            self.input.send("keypress", key)
+
+    def showEvent(self, event: QShowEvent | None) -> None:
+        super().showEvent(event)
+        self._updateFrameInterval()
 
     def mouseMoveEvent(self, event: QMouseEvent | None) -> None:
-        self.unsetCursor()
-        self.cursorTimer.start()
         self._handleMouseEvent(event)
 
     def mousePressEvent(self, event: QMouseEvent | None) -> None:
@@ -221,6 +378,6 @@ class VideoPlayer(QWidget):
     def wheelEvent(self, event: QWheelEvent | None) -> None:
         prefix = self._modifierPrefix(event.modifiers())
         if event.angleDelta().y() < 0:
-            self.player.keypress(prefix + "MOUSE_BTN4")
+            self.input.send("keypress", prefix + "MOUSE_BTN4")
         elif event.angleDelta().y() > 0:
-            self.player.keypress(prefix + "MOUSE_BTN3")
+            self.input.send("keypress", prefix + "MOUSE_BTN3")
@@ -0,0 +1,82 @@
+import threading
+import time
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+EVENT_INTERVAL_MS = 250
+EVENT_QUEUE_LIMIT = 256
+
+
+class EventChannel(QObject):
+    received = pyqtSignal(str, object)
+
+    _posted = pyqtSignal()
+
+    def __init__(self, coalesced: set[str], interval: int = EVENT_INTERVAL_MS) -> None:
+        super().__init__()
+        self._coalesced = coalesced
+        self._interval = interval
+        self._queue: list[tuple[str, object]] = []
+        self._scheduled = False
+        self._urgent = False
+        self._lastFlush = 0.0
+        self._lock = threading.Lock()
+        self.counters = {"posted": 0, "coalesced": 0, "dropped": 0, "overflowed": 0, "delivered": 0}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._posted.connect(self._schedule, Qt.ConnectionType.QueuedConnection)
+
+    def setInterval(self, interval: int) -> None:
+        self._interval = interval
+
+    def post(self, name: str, value: object) -> None:
+        with self._lock:
+            self.counters["posted"] += 1
+            if name in self._coalesced and self._queue and self._queue[-1][0] == name:
+                self._queue[-1] = (name, value)
+                self.counters["coalesced"] += 1
+            else:
+                if len(self._queue) >= EVENT_QUEUE_LIMIT:
+                    self._dropOldest()
+                self._queue.append((name, value))
+
+            wake = not self._scheduled or (name not in self._coalesced and not self._urgent)
+            self._scheduled = True
+            self._urgent = self._urgent or name not in self._coalesced
+        if wake:
+            self._posted.emit()
+
+    def flush(self) -> None:
+        self._timer.stop()
+        with self._lock:
+            queue = self._queue
+            self._queue = []
+            self._scheduled = False
+            self._urgent = False
+            self.counters["delivered"] += len(queue)
+
+        self._lastFlush = time.monotonic()
+        for name, value in queue:
+            self.received.emit(name, value)
+
+    def _dropOldest(self) -> None:
+        for i, (name, _) in enumerate(self._queue):
+            if name in self._coalesced:
+                del self._queue[i]
+                self.counters["dropped"] += 1
+                return
+        # Only state events are queued; they are never dropped, so the queue grows past the limit.
+        self.counters["overflowed"] += 1
+
+    def _schedule(self) -> None:
+        with self._lock:
+            if not self._scheduled:
+                return
+            urgent = self._urgent
+
+        elapsed = (time.monotonic() - self._lastFlush) * 1000
+        delay = 0 if urgent else max(0, round(self._interval - elapsed))
+        if not self._timer.isActive() or delay < self._timer.remainingTime():
+            self._timer.start(delay)
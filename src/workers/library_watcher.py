@@ -0,0 +1,139 @@
+import os
+import time
+from collections.abc import Callable
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from workers.task_runner import TaskRunner
+
+WATCH_DEBOUNCE_MS = 500
+WATCH_MAX_DELAY = 5.0
+
+
+def _watchKey(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _isOwnFile(name: str, ignored: set[str]) -> bool:
+    return any(name == i or (name.startswith(f".{i}.") and name.endswith(".tmp")) for i in ignored)
+
+
+def _listFiles(path: str, ignored: set[str]) -> set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if not _isOwnFile(entry.name, ignored)}
+    except OSError:
+        return set()
+
+
+class LibraryWatcher(QObject):
+    foldersChanged = pyqtSignal(list)
+    candidatesChanged = pyqtSignal(list)
+    titleChanged = pyqtSignal(str)
+
+    def __init__(
+        self, runner: TaskRunner, debounce: int = WATCH_DEBOUNCE_MS, maxDelay: float = WATCH_MAX_DELAY
+    ) -> None:
+        super().__init__()
+        self._runner = runner
+        self._folders: dict[str, str] = {}
+        self._candidates: dict[str, str] = {}
+        self._title: dict[str, str] = {}
+        self._titleFiles: set[str] | None = None
+        self._ignored: set[str] = set()
+        self._watched: dict[str, str] = {}
+        self._changed: set[str] = set()
+        self._firstChange = 0.0
+        self._maxDelay = maxDelay
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._onDirectoryChanged)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce)
+        self._timer.timeout.connect(self._flush)
+
+    def setFolders(self, folders: list[str]) -> None:
+        previous = list(self._folders.values())
+        self._folders = {_watchKey(f): f for f in folders if os.path.isdir(f)}
+        self._unwatch(previous)
+        self._watch(list(self._folders.values()))
+
+    def setIgnored(self, names: list[str]) -> None:
+        self._ignored = set(names)
+
+    def setTitle(self, path: str | None) -> None:
+        previous = list(self._title.values())
+        self._title = {_watchKey(path): path} if path is not None else {}
+        self._titleFiles = None
+        self._unwatch(previous)
+        if path is not None:
+            self._watch([path])
+            self._listTitle(path, self._setTitleFiles)
+
+    def addCandidates(self, paths: list[str]) -> None:
+        self._candidates.update({_watchKey(p): p for p in paths})
+        self._watch(paths)
+
+    def removeCandidates(self, paths: list[str]) -> None:
+        for path in paths:
+            self._candidates.pop(_watchKey(path), None)
+        self._unwatch(paths)
+
+    def _watch(self, paths: list[str]) -> None:
+        missing = {_watchKey(p): p for p in paths if _watchKey(p) not in self._watched}
+        if missing:
+            failed = {_watchKey(p) for p in self._watcher.addPaths(list(missing.values()))}
+            self._watched.update({key: path for key, path in missing.items() if key not in failed})
+
+    def _unwatch(self, paths: list[str]) -> None:
+        keys = {_watchKey(p) for p in paths}
+        stale = [key for key in keys if key in self._watched and not self._isWanted(key)]
+        if stale:
+            self._watcher.removePaths([self._watched.pop(key) for key in stale])
+
+    def _isWanted(self, key: str) -> bool:
+        return key in self._folders or key in self._candidates or key in self._title
+
+    def _onDirectoryChanged(self, path: str) -> None:
+        now = time.monotonic()
+        if not self._timer.isActive():
+            self._firstChange = now
+            self._timer.start()
+        elif now - self._firstChange < self._maxDelay:
+            self._timer.start()
+
+        self._changed.add(_watchKey(path))
+
+    def _flush(self) -> None:
+        changed = self._changed
+        self._changed = set()
+
+        folders = [self._folders[key] for key in changed if key in self._folders]
+        if folders:
+            self.foldersChanged.emit(folders)
+
+        candidates = [self._candidates[key] for key in changed if key in self._candidates]
+        if candidates:
+            self.candidatesChanged.emit(candidates)
+
+        for key in changed:
+            if key in self._title:
+                self._listTitle(self._title[key], self._compareTitleFiles)
+
+    def _listTitle(self, path: str, callback: Callable[[str, set[str]], None]) -> None:
+        ignored = self._ignored
+        task = self._runner.start(lambda _: _listFiles(path, ignored))
+        task.finished.connect(lambda files: callback(path, files))
+
+    def _setTitleFiles(self, path: str, files: set[str]) -> None:
+        if _watchKey(path) in self._title and self._titleFiles is None:
+            self._titleFiles = files
+
+    def _compareTitleFiles(self, path: str, files: set[str]) -> None:
+        if _watchKey(path) not in self._title or files == self._titleFiles:
+            return
+
+        self._titleFiles = files
+        self.titleChanged.emit(path)
@@ -0,0 +1,101 @@
+import threading
+from collections.abc import Callable, Hashable
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from models.episode import Episode, EpisodeConfig
+from workers.task_runner import TaskRunner
+
+WRITE_DELAY_MS = 250
+
+
+def episodeState(episodes: list[Episode]) -> tuple:
+    return tuple((e.path, e.progress, e.completed, e.fingerprint) for e in episodes)
+
+
+def episodeConfigState(config: EpisodeConfig) -> tuple:
+    return (config.index, episodeState(config.episodes))
+
+
+class PersistenceWorker(QObject):
+    saved = pyqtSignal(str, object)
+
+    def __init__(self, runner: TaskRunner, delay: int = WRITE_DELAY_MS) -> None:
+        super().__init__()
+        self._runner = runner
+        self._pending: dict[str, tuple[Hashable, Callable[[], object]]] = {}
+        self._written: dict[str, Hashable] = {}
+        self._queued: list[dict[str, tuple[Hashable, Callable[[], object]]]] = []
+        self._lock = threading.Lock()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._flush)
+
+    def submit(self, key: str, state: Hashable, write: Callable[[], object], immediate: bool = False) -> None:
+        with self._lock:
+            if key not in self._pending and self._written.get(key) == state:
+                return
+        self._pending[key] = (state, write)
+
+        if immediate:
+            self._flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def markClean(self, key: str, state: Hashable) -> None:
+        with self._lock:
+            self._written[key] = state
+
+    def isDirty(self, key: str, state: Hashable) -> bool:
+        with self._lock:
+            return self._written.get(key) != state
+
+    def flush(self) -> None:
+        self._timer.stop()
+        self._runner.waitForDone()
+        pending: dict[str, tuple[Hashable, Callable[[], object]]] = {}
+        with self._lock:
+            for queued in self._queued:
+                pending.update(queued)
+            self._queued = []
+        pending.update(self._pending)
+        self._pending = {}
+        for key, result in self._write(pending).items():
+            self.saved.emit(key, result)
+
+    def _flush(self) -> None:
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = {}
+        with self._lock:
+            self._queued.append(pending)
+        task = self._runner.start(lambda _: self._writeQueued(pending))
+        task.finished.connect(self._onWritten)
+
+    def _writeQueued(self, pending: dict[str, tuple[Hashable, Callable[[], object]]]) -> dict[str, object]:
+        results = self._write(pending)
+        with self._lock:
+            self._queued.remove(pending)
+        return results
+
+    def _onWritten(self, results: dict[str, object]) -> None:
+        for key, result in results.items():
+            self.saved.emit(key, result)
+
+    def _write(self, pending: dict[str, tuple[Hashable, Callable[[], object]]]) -> dict[str, object]:
+        results: dict[str, object] = {}
+        for key, (state, write) in pending.items():
+            if not self.isDirty(key, state):
+                continue
+            try:
+                results[key] = write()
+            except OSError as e:
+                print(f"Failed to save '{key}': {e}")
+                continue
+            self.markClean(key, state)
+        return results
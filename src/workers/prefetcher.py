@@ -0,0 +1,46 @@
+from models.episode import Episode
+from services.read_ahead import warmFile
+from workers.task_runner import Task, TaskRunner
+
+PREFETCH_LEAD = 30.0
+PREFETCH_HEAD = 16 * 1024 * 1024
+PREFETCH_TAIL = 4 * 1024 * 1024
+
+
+class Prefetcher:
+    def __init__(
+        self,
+        runner: TaskRunner,
+        lead: float = PREFETCH_LEAD,
+        headBytes: int = PREFETCH_HEAD,
+        tailBytes: int = PREFETCH_TAIL,
+    ) -> None:
+        self._runner = runner
+        self._lead = lead
+        self._headBytes = headBytes
+        self._tailBytes = tailBytes
+        self._task: Task | None = None
+        self._target: str | None = None
+
+    def update(self, episodes: list[Episode], index: int, remaining: float) -> None:
+        target = episodes[index + 1].path if 0 <= index < len(episodes) - 1 else None
+        if target != self._target:
+            self.cancel()
+        if target is None or self._target is not None or self._lead <= 0 or remaining > self._lead:
+            return
+
+        self._target = target
+        self._task = self._runner.start(lambda task: self._warm(task, target))
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._target = None
+
+    def _warm(self, task: Task, path: str) -> int:
+        try:
+            return warmFile(path, self._headBytes, self._tailBytes, task.isCancelled)
+        except OSError as e:
+            print(f"Failed to prefetch '{path}': {e}")
+            return 0
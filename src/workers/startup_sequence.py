@@ -0,0 +1,52 @@
+import time
+from collections.abc import Callable
+
+from PyQt6.QtCore import QEvent, QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QWidget
+
+import tracing
+
+
+class StartupSequence(QObject):
+    finished = pyqtSignal()
+
+    def __init__(self, window: QWidget, started: float) -> None:
+        super().__init__()
+        self._window = window
+        self._started = started
+        self._stages: list[tuple[str, Callable[[], object]]] = []
+        self.timings: dict[str, float] = {}
+        window.installEventFilter(self)
+
+    def addStage(self, name: str, function: Callable[[], object]) -> None:
+        self._stages.append((name, function))
+
+    def summary(self) -> str:
+        return " ".join(f"{name}={milliseconds:.1f}ms" for name, milliseconds in self.timings.items())
+
+    def eventFilter(self, watched: QObject | None, event: QEvent | None) -> bool:
+        if event is not None and event.type() == QEvent.Type.Paint and "firstFrame" not in self.timings:
+            self._mark("firstFrame")
+            QTimer.singleShot(0, self._onInteractive)
+        return False
+
+    def _onInteractive(self) -> None:
+        self._window.removeEventFilter(self)
+        self._mark("interactive")
+        QTimer.singleShot(0, self._runNextStage)
+
+    def _runNextStage(self) -> None:
+        if not self._stages:
+            self._mark("ready")
+            tracing.setCounters("startup", self.timings)
+            self.finished.emit()
+            return
+
+        name, function = self._stages.pop(0)
+        with tracing.span(f"startup.{name}"):
+            function()
+        self._mark(name)
+        QTimer.singleShot(0, self._runNextStage)
+
+    def _mark(self, name: str) -> None:
+        self.timings[name] = (time.perf_counter() - self._started) * 1000
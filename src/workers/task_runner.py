@@ -0,0 +1,102 @@
+import threading
+import traceback
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, Qt, QThreadPool, pyqtSignal
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class Task(QObject):
+    progress = pyqtSignal(int, int)
+    batch = pyqtSignal(list)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    done = pyqtSignal()
+
+    _progressPosted = pyqtSignal(int, int)
+    _batchPosted = pyqtSignal(list)
+    _finishedPosted = pyqtSignal(object)
+    _failedPosted = pyqtSignal(str)
+
+    def __init__(self, function: Callable[["Task"], object]) -> None:
+        super().__init__()
+        self._function = function
+        self._cancelled = threading.Event()
+        self._progressPosted.connect(self._onProgress, Qt.ConnectionType.QueuedConnection)
+        self._batchPosted.connect(self._onBatch, Qt.ConnectionType.QueuedConnection)
+        self._finishedPosted.connect(self._onFinished, Qt.ConnectionType.QueuedConnection)
+        self._failedPosted.connect(self._onFailed, Qt.ConnectionType.QueuedConnection)
+
+    def run(self) -> None:
+        try:
+            self.checkCancelled()
+            result = self._function(self)
+        except TaskCancelled:
+            return
+        except Exception:
+            traceback.print_exc()
+            self._failedPosted.emit(traceback.format_exc(limit=1))
+            return
+        self._finishedPosted.emit(result)
+
+    def cancel(self) -> None:
+        if not self._cancelled.is_set():
+            self._cancelled.set()
+            self.done.emit()
+
+    def isCancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def checkCancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+
+    def reportProgress(self, done: int, total: int) -> None:
+        self._progressPosted.emit(done, total)
+
+    def reportBatch(self, items: list) -> None:
+        self._batchPosted.emit(items)
+
+    def _onProgress(self, done: int, total: int) -> None:
+        if not self.isCancelled():
+            self.progress.emit(done, total)
+
+    def _onBatch(self, items: list) -> None:
+        if not self.isCancelled():
+            self.batch.emit(items)
+
+    def _onFinished(self, result: object) -> None:
+        if not self.isCancelled():
+            self.finished.emit(result)
+            self.done.emit()
+
+    def _onFailed(self, message: str) -> None:
+        if not self.isCancelled():
+            self.failed.emit(message)
+            self.done.emit()
+
+
+class TaskRunner(QObject):
+    def __init__(self, maxThreads: int | None = None) -> None:
+        super().__init__()
+        self._pool = QThreadPool(self)
+        if maxThreads is not None:
+            self._pool.setMaxThreadCount(maxThreads)
+        self._tasks: set[Task] = set()
+
+    def start(self, function: Callable[[Task], object]) -> Task:
+        task = Task(function)
+        self._tasks.add(task)
+        task.done.connect(lambda: self._tasks.discard(task))
+        self._pool.start(task.run)
+        return task
+
+    def cancelAll(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+
+    def waitForDone(self) -> None:
+        self._pool.waitForDone()
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+import simplejson as json
+
+from models.episode import Episode
+from services.episode_codec import (
+    FORMAT_VERSION,
+    decodeEpisodes,
+    encodeEpisodes,
+    encodeLegacyEpisodeConfig,
+    encodeLegacyEpisodes,
+)
+
+DIRECTORY = os.path.join("library", "Show")
+
+
+def makeEpisodes() -> list[Episode]:
+    other = os.path.join("elsewhere", "Show")
+    return [
+        Episode("01.mkv", os.path.join(DIRECTORY, "01.mkv"), DIRECTORY, 12.5, True, "abc"),
+        Episode("02.mkv", os.path.join(DIRECTORY, "02.mkv"), DIRECTORY, 0.0, False),
+        Episode("03.mkv", os.path.join(other, "03.mkv"), other, 3.0, False, "def"),
+        Episode("04.mkv", os.path.join("moved", "04.mkv"), DIRECTORY, 1.0, False),
+    ]
+
+
+def test_roundTrip() -> None:
+    episodes = makeEpisodes()
+    header, decoded = decodeEpisodes(encodeEpisodes(episodes, DIRECTORY, {"index": 2}), DIRECTORY)
+    assert decoded == episodes
+    assert header["index"] == 2
+    assert header["version"] == FORMAT_VERSION
+
+
+def test_roundTripEmpty() -> None:
+    assert decodeEpisodes(encodeEpisodes([], DIRECTORY), DIRECTORY)[1] == []
+
+
+def test_localBaseFollowsDirectory() -> None:
+    moved = os.path.join("renamed", "Show")
+    episodes = makeEpisodes()[:2]
+    decoded = decodeEpisodes(encodeEpisodes(episodes, DIRECTORY), moved)[1]
+    assert [e.path for e in decoded] == [os.path.join(moved, e.name) for e in episodes]
+    assert all(e.base == moved for e in decoded)
+
+
+def test_decodeLegacyList() -> None:
+    episodes = makeEpisodes()
+    header, decoded = decodeEpisodes(encodeLegacyEpisodes(episodes), DIRECTORY)
+    assert header == {}
+    assert decoded == episodes
+
+
+def test_decodeLegacyConfig() -> None:
+    episodes = makeEpisodes()
+    header, decoded = decodeEpisodes(encodeLegacyEpisodeConfig(1, episodes, {"generation": 3}), DIRECTORY)
+    assert header == {"index": 1, "generation": 3}
+    assert decoded == episodes
+
+
+def test_rejectsNewerVersion() -> None:
+    text = encodeEpisodes(makeEpisodes(), DIRECTORY)
+    first, _, body = text.partition("\n")
+    header = {**json.loads(first), "version": FORMAT_VERSION + 1}
+    with pytest.raises(ValueError):
+        decodeEpisodes(f"{json.dumps(header)}\n{body}", DIRECTORY)
@@ -0,0 +1,87 @@
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from models.episode import Episode, EpisodeConfig
+from services.playlist_journal import PlaylistJournal
+
+
+def makeConfig(directory: Path, count: int = 3) -> EpisodeConfig:
+    episodes = [
+        Episode(f"{i}.mkv", os.path.join(directory, f"{i}.mkv"), str(directory), 0.0, False) for i in range(count)
+    ]
+    return EpisodeConfig(0, episodes)
+
+
+def played(config: EpisodeConfig, row: int, progress: float, completed: bool = False) -> EpisodeConfig:
+    config = config.snapshot()
+    config.episodes[row] = replace(config.episodes[row], progress=progress, completed=completed)
+    return config
+
+
+@pytest.mark.parametrize("compactFormat", [True, False])
+def test_roundTrip(tmp_path: Path, compactFormat: bool) -> None:
+    path = str(tmp_path / "playlist.json")
+    config = makeConfig(tmp_path)
+    journal = PlaylistJournal(path, compactFormat)
+    journal.save(config)
+    config = played(config, 0, 30.0, True)
+    config.index = 1
+    journal.save(config)
+    config = played(config, 1, 12.0)
+    journal.save(config)
+
+    assert os.path.isfile(f"{path}.journal")
+    assert PlaylistJournal(path, compactFormat).load() == config
+
+
+def test_compactsAfterRecordLimit(tmp_path: Path) -> None:
+    path = str(tmp_path / "playlist.json")
+    config = makeConfig(tmp_path)
+    journal = PlaylistJournal(path, compactRecords=2)
+    journal.save(config)
+    for progress in range(1, 4):
+        config = played(config, 0, float(progress))
+        journal.save(config)
+
+    assert PlaylistJournal(path).load() == config
+
+
+def test_newEpisodesCompact(tmp_path: Path) -> None:
+    path = str(tmp_path / "playlist.json")
+    journal = PlaylistJournal(path)
+    journal.save(played(makeConfig(tmp_path), 0, 5.0))
+    config = makeConfig(tmp_path, 2)
+    journal.save(config)
+
+    assert not os.path.isfile(f"{path}.journal")
+    assert PlaylistJournal(path).load() == config
+
+
+def test_ignoresTornRecord(tmp_path: Path) -> None:
+    path = str(tmp_path / "playlist.json")
+    config = makeConfig(tmp_path)
+    journal = PlaylistJournal(path)
+    journal.save(config)
+    saved = played(config, 0, 10.0)
+    journal.save(saved)
+    with open(f"{path}.journal", "a", encoding="utf-8") as file:
+        file.write('{"row": 1, "progr')
+
+    assert PlaylistJournal(path).load() == saved
+    assert not os.path.isfile(f"{path}.journal")
+
+
+def test_ignoresStaleGeneration(tmp_path: Path) -> None:
+    path = str(tmp_path / "playlist.json")
+    config = makeConfig(tmp_path)
+    journal = PlaylistJournal(path)
+    journal.save(config)
+    journal.save(played(config, 0, 10.0))
+    stale = Path(f"{path}.journal").read_text(encoding="utf-8")
+    journal.compact(config)
+    Path(f"{path}.journal").write_text(stale, encoding="utf-8")
+
+    assert PlaylistJournal(path).load() == config
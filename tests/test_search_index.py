@@ -0,0 +1,88 @@
+import pytest
+
+from services.search_index import SearchIndex, normalise
+
+NAMES = [
+    "Show.S01E05.1080p",
+    "Show.S01E12",
+    "Show.S10E05",
+    "Other 1x03",
+    "Season 2 Episode 1",
+    "Brown.S02E01",
+    "Café Society",
+    "Plain",
+]
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    index = SearchIndex()
+    index.setEntries(enumerate(NAMES))
+    return index
+
+
+def matches(index: SearchIndex, query: str) -> set[str]:
+    return {NAMES[key] for key in index.search(query) or {}}
+
+
+@pytest.mark.parametrize(
+    ("text", "tokens"),
+    [
+        ("Show.S01E05", ["show", "s1e5"]),
+        ("Other 1x03", ["other", "s1e3"]),
+        ("Season 2 Episode 1", ["s2e1"]),
+        ("Show S01", ["show", "s1"]),
+        ("Café_Society", ["cafe", "society"]),
+        ("Part 007", ["part", "7"]),
+    ],
+)
+def test_normalise(text: str, tokens: list[str]) -> None:
+    assert normalise(text) == tokens
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("s01e05", {"Show.S01E05.1080p"}),
+        ("S1 E5", {"Show.S01E05.1080p"}),
+        ("S01", {"Show.S01E05.1080p", "Show.S01E12", "Other 1x03"}),
+        ("s01e", {"Show.S01E05.1080p", "Show.S01E12", "Other 1x03"}),
+        ("s01e0", {"Show.S01E05.1080p", "Show.S01E12", "Other 1x03"}),
+        ("1x0", {"Show.S01E05.1080p", "Show.S01E12", "Other 1x03"}),
+        ("s01e1", {"Show.S01E12"}),
+        ("e05", {"Show.S01E05.1080p", "Show.S10E05"}),
+        ("n.S0", {"Brown.S02E01"}),
+        ("show 1080", {"Show.S01E05.1080p"}),
+        ("cafe", {"Café Society"}),
+        ("xyz", set()),
+    ],
+)
+def test_search(index: SearchIndex, query: str, expected: set[str]) -> None:
+    assert matches(index, query) == expected
+
+
+def test_exactOutranksPrefix(index: SearchIndex) -> None:
+    index.addEntries([(len(NAMES), "Show.S01E01")])
+    scores = index.search("s01e1")
+    assert scores is not None
+    assert scores[len(NAMES)] > scores[NAMES.index("Show.S01E12")]
+
+
+def test_emptyQuery(index: SearchIndex) -> None:
+    assert index.search("") is None
+    assert index.search(" . ") is None
+
+
+@pytest.mark.parametrize("query", ["Show.S01E05", "show s10e05", "other 1x03", "n.S02E01", "season 2 episode 1"])
+def test_incrementalNarrowing(index: SearchIndex, query: str) -> None:
+    for end in range(1, len(query) + 1):
+        incremental = index.search(query[:end])
+        fresh = SearchIndex()
+        fresh.setEntries(enumerate(NAMES))
+        assert incremental == fresh.search(query[:end]), query[:end]
+
+
+def test_removeEntries(index: SearchIndex) -> None:
+    index.removeEntries([NAMES.index("Show.S01E12")])
+    assert matches(index, "s01e") == {"Show.S01E05.1080p", "Other 1x03"}
+    assert matches(index, "s01e12") == set()